@@ -8,6 +8,18 @@ try:
 except:
     from collections import namedtuple
     from struct import unpack
+from array import array
+try:
+    from micropython import schedule
+    from utime import ticks_ms, ticks_diff
+except:
+    from time import monotonic
+    def schedule(func, arg):
+        func(arg)
+    def ticks_ms():
+        return int(monotonic() * 1000)
+    def ticks_diff(a, b):
+        return a - b
 
 compat_str = '\nUnified PiicoDev library out of date.  Get the latest module: https://piico.dev/unified \n'
 
@@ -49,6 +61,61 @@ _VAL_OPMODE_RESET      = 0xF0
 
 AQI_Tuple = namedtuple("AQI", ("value", "rating"))
 ECO2_Tuple = namedtuple("eCO2", ("value", "rating"))
+# constant tables so the properties do not build them on every read
+_AQI_TUPLES = tuple(AQI_Tuple(v, r) for v, r in enumerate(('invalid', 'excellent', 'good', 'moderate', 'poor', 'unhealthy')))
+_AQI_NONE = AQI_Tuple(None, '')
+_ECO2_RATINGS = ((1500, 'bad'), (1000, 'poor'), (800, 'fair'), (600, 'good'))
+_ECO2_NONE = ECO2_Tuple(None, '')
+_OPERATIONS = ('operating ok', 'warm-up', 'initial start-up', 'no valid output')
+# one consistent reading; aqi/tvoc/eco2 are None until the first result,
+# temperature/humidity None unless read_all(compensation=True)
+Sample = namedtuple("Sample", ("status", "aqi", "tvoc", "eco2", "temperature", "humidity"))
+
+# bits of PiicoDev_ENS160._viewed, one per snapshot view
+_VIEW_STATUS = 1
+_VIEW_AQI = 2
+_VIEW_TVOC = 4
+_VIEW_ECO2 = 8
+
+
+class SampleRing(object):
+    # Fixed-capacity FIFO of samples in preallocated arrays, filled from
+    # the data-ready interrupt; the oldest sample is overwritten when full
+    def __init__(self, size):
+        self.size = size
+        zeros = [0] * size
+        self.status = array('B', zeros)
+        self.aqi = array('B', zeros)
+        self.tvoc = array('H', zeros)
+        self.eco2 = array('H', zeros)
+        self.ticks = array('l', zeros)
+        self.head = 0  # next slot to write
+        self.count = 0
+        self.overruns = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, status, aqi, tvoc, eco2, ticks):
+        i = self.head
+        self.status[i] = status
+        self.aqi[i] = aqi
+        self.tvoc[i] = tvoc
+        self.eco2[i] = eco2
+        self.ticks[i] = ticks
+        self.head = (i + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+        else:
+            self.overruns += 1
+
+    def pop(self):
+        # oldest sample as (ticks, Sample), or None when empty
+        if not self.count:
+            return None
+        i = (self.head - self.count) % self.size
+        self.count -= 1
+        return self.ticks[i], Sample(self.status[i], self.aqi[i], self.tvoc[i], self.eco2[i], None, None)
 
 
 def _read_bit(x, n):
@@ -73,7 +140,7 @@ def _write_bit(x, n, b):
         return _set_bit(x, n)
 
 class PiicoDev_ENS160(object):
-    def __init__(self, bus=None, freq=None, sda=None, scl=None, address=_I2C_ADDRESS, asw=None, intdat=False, intgpr=False, int_cfg=0, intpol=0, temperature=25.0, humidity=50.0):
+    def __init__(self, bus=None, freq=None, sda=None, scl=None, address=_I2C_ADDRESS, asw=None, intdat=False, intgpr=False, int_cfg=0, intpol=0, temperature=25.0, humidity=50.0, int_pin=None, ring_size=16, max_age_ms=1000, i2c=None):
         if asw == 0: self.address = _I2C_ADDRESS
         elif asw == 1: self.address = _I2C_ADDRESS - 1
         else: self.address = address
@@ -84,8 +151,11 @@ class PiicoDev_ENS160(object):
                 print(compat_str)
         except:
             print(compat_str)
-        self.i2c = create_unified_i2c(bus=bus, freq=freq, sda=sda, scl=scl)
+        # i2c: an existing bus object or unified handle to share
+        self.i2c = create_unified_i2c(bus=bus, freq=freq, sda=sda, scl=scl, i2c=i2c)
         config = 0x00
+        if int_pin is not None:
+            intdat = True
         if intdat or intgpr:
             config = _set_bit(config, _BIT_CONFIG_INTEN)
             config = _write_bit(config, _BIT_CONFIG_INTDAT, intdat)
@@ -93,24 +163,74 @@ class PiicoDev_ENS160(object):
         config = _write_bit(config, _BIT_CONFIG_INT_CFG, int_cfg)
         config = _write_bit(config, _BIT_CONFIG_INTPOL, intpol)
         self.config = config
+        # preallocated transfer buffers, the sample path does not allocate
+        self._data = bytearray(6)  # DEVICE_STATUS, DATA_AQI, DATA_TVOC, DATA_ECO2
+        self._comp = bytearray(4)  # DATA_T, DATA_RH
+        self._byte = bytearray(1)
+        self._word = bytearray(2)
+        # latest snapshot, decoded from the buffers above
+        self._status = None
         self._aqi = None
         self._tvoc = None
         self._eco2 = None
+        self._t_raw = None
+        self._rh_raw = None
+        self._eco2_tuple = _ECO2_NONE
+        self._viewed = 0
+        self._read_at = 0
+        # a snapshot younger than this is served again instead of polling;
+        # the sensor publishes one result per second in standard mode
+        self.max_age_ms = max_age_ms
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # last value written to TEMP_IN, RH_IN, CONFIG and OPMODE
+        self._reg_cache = {}
+        self.writes_skipped = 0
+        self.int_pin = int_pin
+        self.ring = None
+        self.dropped = 0  # data-ready interrupts lost to a full schedule queue
         try:
             part_id = self._read_int(_REG_PART_ID, 2)
             if part_id != _VAL_PART_ID:
                 print('Device is not PiicoDev ENS160')
                 raise SystemExit
-            self._write_int(_REG_OPMODE, _VAL_OPMODE_STANDARD, 1)
+            self._write_reg(_REG_OPMODE, _VAL_OPMODE_STANDARD, 1)
             sleep_ms(20)
             opmode = self._read_int(_REG_OPMODE, 1)
             sleep_ms(20)
-            self._write_int(_REG_CONFIG, self.config, 1)
+            self._write_reg(_REG_CONFIG, self.config, 1)
             self.temperature = temperature
             self.humidity = humidity
         except Exception as e:
             print(i2c_err_str.format(self.address))
             raise e
+        if int_pin is not None:
+            self.ring = SampleRing(ring_size)
+            self._status = 0
+            self._ready_cb = self._ready  # bound once, the IRQ must not allocate
+            trigger = int_pin.IRQ_RISING if intpol else int_pin.IRQ_FALLING
+            int_pin.irq(handler=self._irq, trigger=trigger)
+            if int_pin.value() == intpol:
+                self._ready(0)  # already asserted, no edge will come until it is read
+
+    def _irq(self, pin):
+        try:
+            schedule(self._ready_cb, 0)
+        except RuntimeError:
+            self.dropped += 1
+
+    def _ready(self, _):
+        # scheduled after a data-ready interrupt: one burst read into the ring
+        if self._update(False) and _read_bit(self._status, _BIT_DEVICE_STATUS_NEWDAT):
+            self.ring.push(self._status, self._aqi, self._tvoc, self._eco2, ticks_ms())
+
+    @property
+    def pending(self):
+        return len(self.ring) if self.ring is not None else 0
+
+    def pop(self):
+        # oldest buffered (ticks_ms, Sample) from the data-ready interrupt, no bus traffic
+        return self.ring.pop() if self.ring is not None else None
         
     def _read(self, register, length=1, bytestring=False):
         try:
@@ -125,30 +245,143 @@ class PiicoDev_ENS160(object):
         
     def _write(self, register, data):
         try:
-            return self.i2c.writeto_mem(self.address, register, data)
+            self.i2c.writeto_mem(self.address, register, data)
+            return True
         except:
             print(i2c_err_str.format(self.address))
             return None
 
+    def _read_into(self, register, buf):
+        try:
+            self.i2c.readfrom_mem_into(self.address, register, buf)
+            return True
+        except:
+            print(i2c_err_str.format(self.address))
+            return False
+
     def _read_int(self, register, length=1):
-        return int.from_bytes(self._read(register, length),'little')
+        if length == 1:
+            self.i2c.readfrom_mem_into(self.address, register, self._byte)
+            return self._byte[0]
+        buf = self._word
+        self.i2c.readfrom_mem_into(self.address, register, buf)
+        return buf[0] | buf[1] << 8
 
     def _write_int(self, register, integer, length=1):
-        return self._write(register, int.to_bytes(integer,length,'little'))
+        if length == 1:
+            buf = self._byte
+        else:
+            buf = self._word
+            buf[1] = integer >> 8 & 0xFF
+        buf[0] = integer & 0xFF
+        return self._write(register, buf)
+
+    def _write_reg(self, register, integer, length=1):
+        # Write-through cache for the writable registers: a write that would
+        # leave the register at the value last written is skipped. Values
+        # are compared after quantisation, so e.g. temperatures within the
+        # same 1/64 K step cost no transaction.
+        if self._reg_cache.get(register) == integer:
+            self.writes_skipped += 1
+            return True
+        ok = self._write_int(register, integer, length)
+        if register == _REG_OPMODE and integer == _VAL_OPMODE_RESET:
+            self._reg_cache.clear()  # the reset restores the register defaults
+        elif ok:
+            self._reg_cache[register] = integer
+        else:
+            self._reg_cache.pop(register, None)  # unknown after a failed write
+        return ok
+
+    def _read_both(self):
+        # the data burst and the DATA_T/DATA_RH readback as one batch
+        try:
+            with self.i2c.batch() as b:
+                b.read(self.address, _REG_DEVICE_STATUS, self._data)
+                b.read(self.address, _REG_DATA_T, self._comp)
+            return True
+        except:
+            print(i2c_err_str.format(self.address))
+            return False
+
+    def _update(self, compensation):
+        # DEVICE_STATUS, DATA_AQI, DATA_TVOC and DATA_ECO2 in one burst, plus
+        # DATA_T and DATA_RH in the same batch if compensation is set.
+        # Decodes into the snapshot attributes without allocating (the
+        # batch allocates its queue).
+        data = self._data
+        if compensation:
+            if not self._read_both():
+                return False
+        elif not self._read_into(_REG_DEVICE_STATUS, data):
+            return False
+        status = data[0]
+        if _read_bit(status, _BIT_DEVICE_STATUS_NEWDAT):
+            self._aqi = data[1] & 0x07
+            self._tvoc = data[2] | data[3] << 8
+            self._eco2 = data[4] | data[5] << 8
+        self._status = status
+        self._t_raw = self._rh_raw = None
+        if compensation:
+            comp = self._comp
+            self._t_raw = comp[0] | comp[1] << 8
+            self._rh_raw = comp[2] | comp[3] << 8
+        self._viewed = 0
+        self._read_at = ticks_ms()
+        return True
+
+    def read_all(self, compensation=False, into=None):
+        # Read a new snapshot and return it as a Sample. With into, an
+        # array('H') or list of at least 6 items, the raw values (status,
+        # aqi, tvoc, eco2, temperature in 1/64 K, humidity in 1/512 %) are
+        # stored there instead and nothing is allocated; unset values are 0.
+        self._update(compensation)
+        if into is None:
+            return self.sample
+        into[0] = self._status or 0
+        into[1] = self._aqi or 0
+        into[2] = self._tvoc or 0
+        into[3] = self._eco2 or 0
+        into[4] = self._t_raw or 0
+        into[5] = self._rh_raw or 0
+        return into
+
+    @property
+    def sample(self):
+        # the latest snapshot as a Sample, None before the first read
+        if self._status is None:
+            return None
+        temperature = humidity = None
+        if self._t_raw is not None:
+            temperature = self._t_raw / 64 - 273.15
+            humidity = self._rh_raw / 512
+        return Sample(self._status, self._aqi, self._tvoc, self._eco2, temperature, humidity)
+
+    def _view(self, bit):
+        # Properties are views over the latest snapshot. A new snapshot is
+        # read once the snapshot is max_age_ms old, whichever value is
+        # viewed, so reading aqi, tvoc and eco2 together costs one burst
+        # and gives one measurement, and reading them faster than the
+        # sensor produces results costs nothing. With max_age_ms=0 a new
+        # snapshot is read when a value is viewed a second time instead.
+        # With an interrupt pin the snapshot is refreshed by the data-ready
+        # interrupt and views never touch the bus.
+        if self.ring is None and (self._status is None or (
+                ticks_diff(ticks_ms(), self._read_at) >= self.max_age_ms if self.max_age_ms
+                else self._viewed & bit)):
+            self.cache_misses += 1
+            self._update(False)
+        else:
+            self.cache_hits += 1
+        self._viewed |= bit
 
-    def _read_data(self):
-        device_status = self._read_int(_REG_DEVICE_STATUS)
-        if _read_bit(device_status, _BIT_DEVICE_STATUS_NEWDAT) is True:
-            data = self._read(_REG_DEVICE_STATUS, 6, bytestring=True)
-            self._status, self._aqi, self._tvoc, self._eco2 = unpack('<bbhh', data)
-    
     @property    
     def humidity(self):
         return self._read_int(_REG_DATA_RH, 2) / 512
     
     @humidity.setter
     def humidity(self, humidity):
-        self._write_int(_REG_RH_IN, int(humidity) * 512, 2)
+        self._write_reg(_REG_RH_IN, int(humidity) * 512, 2)
     
     @property
     def temperature(self):
@@ -158,11 +391,11 @@ class PiicoDev_ENS160(object):
     @temperature.setter
     def temperature(self, temperature):
         kelvin = temperature + 273.15
-        self._write_int(_REG_TEMP_IN, int(kelvin * 64), 2)
+        self._write_reg(_REG_TEMP_IN, int(kelvin * 64), 2)
     
     @property
     def status(self):
-        self._read_data()
+        self._view(_VIEW_STATUS)
         return self._status
     
     @property
@@ -187,43 +420,33 @@ class PiicoDev_ENS160(object):
     
     @property
     def operation(self):
-        return ['operating ok', 'warm-up', 'initial start-up', 'no valid output'][self.status_validity_flag]
+        return _OPERATIONS[self.status_validity_flag]
     
     @property
     def aqi(self):
-        self._read_data()
+        self._view(_VIEW_AQI)
         if self._aqi is not None:
-            ratings={0: 'invalid', 1:'excellent', 2:'good', 3:'moderate', 4:'poor', 5:'unhealthy'}
-            aqi = _read_tribit(self._aqi, 0)
-            return AQI_Tuple(aqi, ratings[aqi])
+            return _AQI_TUPLES[self._aqi]
         else:
-            return AQI_Tuple(None, '')
+            return _AQI_NONE
 
     @property
     def tvoc(self):
-        self._read_data()
-        if self._tvoc is not None:
-            return self._tvoc
-        else:
-            return None
+        self._view(_VIEW_TVOC)
+        return self._tvoc
     
     @property
     def eco2(self):
-        self._read_data()
-        if self._eco2 is not None:
-            eco2 = self._eco2
-            rating = 'invalid'
-            if eco2 >= 400:
-                rating = 'excellent'
-            if eco2 > 600:
-                rating = 'good'
-            if eco2 > 800:
-                rating = 'fair'
-            if eco2 > 1000:
-                rating = 'poor'
-            if eco2 > 1500:
-                rating = 'bad'
-            return ECO2_Tuple(eco2, rating)
-        else:
-            return ECO2_Tuple(None, '')
-        
+        self._view(_VIEW_ECO2)
+        eco2 = self._eco2
+        if eco2 is None:
+            return _ECO2_NONE
+        if eco2 != self._eco2_tuple.value:
+            # a new tuple only when the value changes
+            rating = 'excellent' if eco2 >= 400 else 'invalid'
+            for limit, name in _ECO2_RATINGS:
+                if eco2 > limit:
+                    rating = name
+                    break
+            self._eco2_tuple = ECO2_Tuple(eco2, rating)
+        return self._eco2_tuple
@@ -0,0 +1,72 @@
+# Text layout for framebuf displays: static labels are rasterised once
+# into a cached MONO_VLSB strip, value fields are fixed-width boxes
+# redrawn only where their characters change.
+
+import framebuf
+
+CHAR_W = 8
+CHAR_H = 8
+
+
+class Layout:
+    def __init__(self, display):
+        self.display = display
+        self._labels = []  # (text, x, y)
+        self._fields = {}  # name -> [x, y, width in chars, text on screen]
+        self._strip = None  # (FrameBuffer, x, y) holding every label
+
+    def label(self, text, x, y):
+        self._labels.append((text, x, y))
+        self._strip = None
+
+    def field(self, name, x, y, width):
+        self._fields[name] = [x, y, width, None]
+
+    def _rasterise(self):
+        x0 = min(x for _, x, _ in self._labels)
+        y0 = min(y for _, _, y in self._labels)
+        x1 = max(x + CHAR_W * len(text) for text, x, _ in self._labels)
+        y1 = max(y + CHAR_H for _, _, y in self._labels)
+        w = x1 - x0
+        h = y1 - y0
+        fb = framebuf.FrameBuffer(bytearray(w * ((h + 7) // 8)), w, h, framebuf.MONO_VLSB)
+        for text, x, y in self._labels:
+            fb.text(text, x - x0, y - y0)
+        self._strip = (fb, x0, y0)
+
+    def draw(self):
+        # Paint the labels and blank every field box. Call after anything
+        # else has drawn over the layout; fields redraw on their next set().
+        if self._labels:
+            if self._strip is None:
+                self._rasterise()
+            fb, x, y = self._strip
+            self.display.blit(fb, x, y)
+        for f in self._fields.values():
+            self.display.fill_rect(f[0], f[1], CHAR_W * f[2], CHAR_H, 0)
+            f[3] = " " * f[2]
+
+    def set(self, name, value):
+        # Show value in the named field, padded or truncated to its
+        # width. Returns True if any character changed.
+        f = self._fields[name]
+        x, y, width, old = f
+        text = str(value)
+        if len(text) < width:
+            text = text + " " * (width - len(text))
+        else:
+            text = text[:width]
+        if old is None:
+            old = "\0" * width  # never drawn, redraw every cell
+        if text == old:
+            return False
+        display = self.display
+        for i in range(width):
+            ch = text[i]
+            if ch != old[i]:
+                cx = x + CHAR_W * i
+                display.fill_rect(cx, y, CHAR_W, CHAR_H, 0)
+                if ch != " ":
+                    display.text(ch, cx, y)
+        f[3] = text
+        return True
@@ -2,6 +2,7 @@
 
 from micropython import const
 import framebuf
+import time
 
 
 # register definitions
@@ -22,21 +23,62 @@ SET_DISP_CLK_DIV = const(0xD5)
 SET_PRECHARGE = const(0xD9)
 SET_VCOM_DESEL = const(0xDB)
 SET_CHARGE_PUMP = const(0x8D)
+SET_HSCROLL = const(0x26)  # | 1 to scroll left
+SET_VHSCROLL = const(0x29)  # + 1 to scroll left
+SET_CONTENT_SCROLL = const(0x2C)  # | 1 to scroll left, SSD1306B and later
+SET_SCROLL_OFF = const(0x2E)
+SET_SCROLL_ON = const(0x2F)
+SET_VSCROLL_AREA = const(0xA3)
+
+# continuous scroll step interval in frames -> register value
+SCROLL_RATES = {2: 0x07, 3: 0x04, 4: 0x05, 5: 0x00, 25: 0x06, 64: 0x01, 128: 0x02, 256: 0x03}
+# content scroll needs two frame periods (~105 Hz) between steps
+FEED_INTERVAL_MS = const(20)
+# data bytes sent per pump() step, about 3 ms of I2C at 400 kHz
+CHUNK = const(128)
+
+# approximate bus bytes spent opening a new window, used to decide
+# whether two changed spans on a page are cheaper to send as one
+WINDOW_COST = const(12)
 
 # Subclassing FrameBuffer provides support for graphics primitives
 # http://docs.micropython.org/en/latest/pyboard/library/framebuf.html
 class SSD1306(framebuf.FrameBuffer):
-    def __init__(self, width, height, external_vcc):
+    def __init__(self, width, height, external_vcc, shadow=False, double_buffer=False, content_scroll=True):
         self.width = width
         self.height = height
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        # dirty column span per page; x0 > x1 means the page is clean
+        self._clean_x0 = b"\xff" * self.pages
+        self._clean_x1 = bytes(self.pages)
+        self._dirty_x0 = bytearray(self._clean_x0)
+        self._dirty_x1 = bytearray(self._clean_x1)
+        self.bytes_saved = 0  # bytes not sent by the last show()
+        self.bytes_saved_total = 0
+        # copy of the last transmitted frame, diffed against on show()
+        self._shadow = bytearray(len(self.buffer)) if shadow else None
+        self._resync = True  # display RAM contents unknown
+        # drawing goes to self.buffer, transfers read the front buffer
+        self._front = bytearray(len(self.buffer)) if double_buffer else self.buffer
+        self._queue = []  # windows (p0, p1, start, stop) awaiting transfer
+        self._pos = -1  # next byte to send in _queue[0], -1 if not opened
+        self._locked = False  # set while the queue is being changed
+        self.scroll_frames = 5
+        # content scroll (0x2C/0x2D) needs an SSD1306B or later controller
+        self.content_scroll = content_scroll
+        self._last_feed = time.ticks_ms()
+        # preallocated command sequences, sent as one transaction each
+        self._cmd2 = bytearray(2)
+        self._cmd3 = bytearray(3)
+        self._window = bytearray((SET_COL_ADDR, 0, 0, SET_PAGE_ADDR, 0, 0))
+        self._scroll = bytearray(8)
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
 
     def init_display(self):
-        for cmd in (
+        self.write_cmds(bytes((
             SET_DISP | 0x00,  # off
             # address setting
             SET_MEM_ADDR,
@@ -66,61 +108,425 @@ class SSD1306(framebuf.FrameBuffer):
             # charge pump
             SET_CHARGE_PUMP,
             0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01,
-        ):  # on
-            self.write_cmd(cmd)
+            SET_DISP | 0x01,  # on
+        )))
         self.fill(0)
         self.show()
 
     def poweroff(self):
-        self.write_cmd(SET_DISP | 0x00)
+        # display off, then stop the charge pump
+        cmds = self._cmd3
+        cmds[0] = SET_DISP | 0x00
+        cmds[1] = SET_CHARGE_PUMP
+        cmds[2] = 0x10
+        self.write_cmds(cmds)
 
     def poweron(self):
-        self.write_cmd(SET_DISP | 0x01)
+        cmds = self._cmd3
+        cmds[0] = SET_CHARGE_PUMP
+        cmds[1] = 0x10 if self.external_vcc else 0x14
+        cmds[2] = SET_DISP | 0x01
+        self.write_cmds(cmds)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        cmds = self._cmd2
+        cmds[0] = SET_CONTRAST
+        cmds[1] = contrast
+        self.write_cmds(cmds)
 
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
-    def show(self):
-        x0 = 0
-        x1 = self.width - 1
-        if self.width == 64:
-            # displays with width of 64 pixels are shifted by 32
-            x0 += 32
-            x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+    def mark_dirty(self, x, y, w, h):
+        # clip to the display and widen the dirty span of every touched page
+        x0 = max(x, 0)
+        x1 = min(x + w, self.width) - 1
+        y0 = max(y, 0)
+        y1 = min(y + h, self.height) - 1
+        if x0 > x1 or y0 > y1:
+            return
+        dx0 = self._dirty_x0
+        dx1 = self._dirty_x1
+        for page in range(y0 >> 3, (y1 >> 3) + 1):
+            if x0 < dx0[page]:
+                dx0[page] = x0
+            if x1 > dx1[page]:
+                dx1[page] = x1
+
+    def invalidate(self):
+        # resend the whole frame, bypassing the shadow diff
+        self._resync = True
+        self.mark_dirty(0, 0, self.width, self.height)
+
+    # drawing primitives record the area they touch before drawing
+    def fill(self, c):
+        self.mark_dirty(0, 0, self.width, self.height)
+        super().fill(c)
+
+    def pixel(self, x, y, *c):
+        if c:
+            self.mark_dirty(x, y, 1, 1)
+        return super().pixel(x, y, *c)
+
+    def hline(self, x, y, w, c):
+        self.mark_dirty(x, y, w, 1)
+        super().hline(x, y, w, c)
+
+    def vline(self, x, y, h, c):
+        self.mark_dirty(x, y, 1, h)
+        super().vline(x, y, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        self.mark_dirty(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)
+        super().line(x1, y1, x2, y2, c)
+
+    def rect(self, x, y, w, h, c, *f):
+        self.mark_dirty(x, y, w, h)
+        super().rect(x, y, w, h, c, *f)
+
+    def fill_rect(self, x, y, w, h, c):
+        self.mark_dirty(x, y, w, h)
+        super().fill_rect(x, y, w, h, c)
+
+    def ellipse(self, x, y, xr, yr, c, *args):
+        self.mark_dirty(x - xr, y - yr, 2 * xr + 1, 2 * yr + 1)
+        super().ellipse(x, y, xr, yr, c, *args)
+
+    def poly(self, x, y, coords, c, *f):
+        xs = coords[0::2]
+        ys = coords[1::2]
+        self.mark_dirty(x + min(xs), y + min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+        super().poly(x, y, coords, c, *f)
+
+    def text(self, s, x, y, *c):
+        self.mark_dirty(x, y, 8 * len(s), 8)
+        super().text(s, x, y, *c)
+
+    def blit(self, fbuf, x, y, *args):
+        if isinstance(fbuf, tuple):
+            # (buffer, width, height, format[, stride]) source has known size
+            self.mark_dirty(x, y, fbuf[1], fbuf[2])
+        else:
+            # FrameBuffer sources don't expose their size
+            self.mark_dirty(x, y, self.width - x, self.height - y)
+        super().blit(fbuf, x, y, *args)
+
+    def blit_pages(self, data, width, x=0, page=0):
+        # Copy a page-ordered MONO_VLSB image (see tools/img2vlsb.py) of
+        # the given width with its left edge at column x and its top at
+        # page, one slice per page instead of a per-pixel blit.
+        pages = len(data) // width
+        x0 = max(x, 0)
+        x1 = min(x + width, self.width)
+        p0 = max(page, 0)
+        p1 = min(page + pages, self.pages)
+        if x0 >= x1 or p0 >= p1:
+            return
+        buf = self.buffer
+        src = memoryview(data)
+        n = x1 - x0
+        for p in range(p0, p1):
+            dst = p * self.width + x0
+            start = (p - page) * width + x0 - x
+            buf[dst : dst + n] = src[start : start + n]
+        self.mark_dirty(x0, p0 * 8, n, (p1 - p0) * 8)
+
+    def scroll(self, xstep, ystep):
+        self.mark_dirty(0, 0, self.width, self.height)
+        super().scroll(xstep, ystep)
+
+    def scroll_rate(self, frames):
+        if frames not in SCROLL_RATES:
+            raise ValueError("scroll rate must be one of {}".format(sorted(SCROLL_RATES)))
+        self.scroll_frames = frames
+
+    def scroll_setup(self, left=False, start=0, end=None, vertical=0):
+        # continuous scroll of pages start..end every scroll_frames frames;
+        # vertical is the row offset per step (0..63) and selects the
+        # combined vertical and horizontal scroll
+        if end is None:
+            end = self.pages - 1
+        cmds = self._scroll
+        cmds[0] = SET_SCROLL_OFF
+        cmds[1] = SET_VHSCROLL + (left & 1) if vertical else SET_HSCROLL | (left & 1)
+        cmds[2] = 0x00
+        cmds[3] = start
+        cmds[4] = SCROLL_RATES[self.scroll_frames]
+        cmds[5] = end
+        if vertical:
+            cmds[6] = vertical
+            self.write_cmds(memoryview(cmds)[:7])
+        else:
+            cmds[6] = 0x00
+            cmds[7] = 0xFF
+            self.write_cmds(cmds)
+
+    def scroll_area(self, top, rows):
+        # rows top..top+rows-1 take part in vertical scrolling
+        cmds = self._cmd3
+        cmds[0] = SET_VSCROLL_AREA
+        cmds[1] = top
+        cmds[2] = rows
+        self.write_cmds(cmds)
+
+    def scroll_on(self):
+        self.write_cmd(SET_SCROLL_ON)
+
+    def scroll_off(self):
+        self.write_cmd(SET_SCROLL_OFF)
+        # display RAM is undefined after a continuous scroll and must be rewritten
+        self.invalidate()
+
+    def feed_column(self, column):
+        # Shift the whole display one column left with the controller's
+        # content scroll and write column (one byte per page, MONO_VLSB)
+        # into the freed rightmost column. Without content_scroll (an
+        # original SSD1306) the shifted frame is redrawn with show()
+        # instead. Returns False without doing anything if the previous
+        # step is less than FEED_INTERVAL_MS old or a frame transfer is
+        # still in progress.
+        now = time.ticks_ms()
+        if self._queue or time.ticks_diff(now, self._last_feed) < FEED_INTERVAL_MS:
+            return False
+        self._last_feed = now
+        width = self.width
+        buf = self.buffer
+        if not self.content_scroll:
+            for page in range(self.pages):
+                start = page * width
+                buf[start : start + width - 1] = buf[start + 1 : start + width]
+                buf[start + width - 1] = column[page]
+            self.mark_dirty(0, 0, width, self.height)
+            self.show()
+            return True
+        offset = 32 if width == 64 else 0
+        x1 = width - 1 + offset
+        cmds = self._scroll
+        cmds[0] = SET_CONTENT_SCROLL | 0x01
+        cmds[1] = 0x00
+        cmds[2] = 0
+        cmds[3] = 0x01
+        cmds[4] = self.pages - 1
+        cmds[5] = 0x00
+        cmds[6] = offset
+        cmds[7] = x1
+        self.write_cmds(cmds)
+        # mirror the shift in the buffer, the shadow of display RAM and the
+        # dirty spans, so drawing not yet shown is still sent by show()
+        shadow = self._shadow
+        dx0 = self._dirty_x0
+        dx1 = self._dirty_x1
+        for page in range(self.pages):
+            start = page * width
+            buf[start : start + width - 1] = buf[start + 1 : start + width]
+            buf[start + width - 1] = column[page]
+            if shadow is not None:
+                shadow[start : start + width - 1] = shadow[start + 1 : start + width]
+                shadow[start + width - 1] = column[page]
+            if dx0[page] <= dx1[page]:
+                if dx1[page] == 0:
+                    dx0[page] = 0xFF  # shifted off the left edge
+                else:
+                    dx0[page] = max(dx0[page] - 1, 0)
+                    dx1[page] -= 1
+        self.write_window(x1, x1, 0, self.pages - 1, column)
+        return True
+
+    def show(self, full=False):
+        self.present(full)
+        self._locked = True
+        try:
+            self._pump(None)
+        finally:
+            self._locked = False
+
+    def present(self, full=False):
+        # Hand the frame drawn so far to the transfer queue; pump() then
+        # sends it in chunks while drawing continues. A transfer still in
+        # flight is completed first.
+        self._locked = True
+        try:
+            self._pump(None)
+            self._plan(full)
+        finally:
+            self._locked = False
+
+    def _plan(self, full):
+        if full:
+            self.invalidate()
+        if self._front is not self.buffer:
+            self._front[:] = self.buffer
+        width = self.width
+        dx0 = self._dirty_x0
+        dx1 = self._dirty_x1
+        diff = self._shadow is not None and not self._resync
+        sent = 0
+        page = 0
+        while page < self.pages:
+            x0 = dx0[page]
+            x1 = dx1[page]
+            if x0 > x1:
+                page += 1
+                continue
+            start = page * width
+            if diff:
+                for a, b in self._changed(start + x0, start + x1 + 1):
+                    sent += self._queue_window(page, page, a, b)
+                page += 1
+                continue
+            end = page
+            if x0 == 0 and x1 == width - 1:
+                # consecutive full-width pages are contiguous in the buffer
+                while end + 1 < self.pages and dx0[end + 1] == 0 and dx1[end + 1] == width - 1:
+                    end += 1
+            sent += self._queue_window(page, end, start + x0, end * width + x1 + 1)
+            page = end + 1
+        dx0[:] = self._clean_x0
+        dx1[:] = self._clean_x1
+        self._resync = False
+        self.bytes_saved = len(self.buffer) - sent
+        self.bytes_saved_total += self.bytes_saved
+
+    @property
+    def busy(self):
+        return bool(self._queue)
+
+    def pump(self, budget=CHUNK):
+        # Send up to budget bytes (None for no limit) of the presented
+        # frame. Returns True while more remains. Safe to call from a
+        # soft timer callback or an asyncio task.
+        if self._locked:
+            return bool(self._queue)
+        self._locked = True
+        try:
+            return self._pump(budget)
+        finally:
+            self._locked = False
+
+    def _pump(self, budget):
+        queue = self._queue
+        width = self.width
+        offset = 32 if width == 64 else 0  # displays with width of 64 pixels are shifted by 32
+        front = memoryview(self._front)
+        while queue:
+            p0, p1, start, stop = queue[0]
+            pos = self._pos
+            if pos < 0:
+                x0 = start - p0 * width + offset
+                x1 = stop - 1 - p1 * width + offset
+                if budget is None or stop - start <= budget:
+                    # the whole window fits what is left of the budget
+                    self.write_window(x0, x1, p0, p1, front[start:stop])
+                    pos = stop
+                    if budget is not None:
+                        budget -= stop - start
+                else:
+                    # open the window, the address pointer persists between writes
+                    cmds = self._window
+                    cmds[1] = x0
+                    cmds[2] = x1
+                    cmds[4] = p0
+                    cmds[5] = p1
+                    self.write_cmds(cmds)
+                    pos = start
+            if pos < stop:
+                n = stop - pos
+                if budget is not None and n > budget:
+                    n = budget
+                self.write_data(front[pos : pos + n])
+                pos += n
+                if budget is not None:
+                    budget -= n
+            if pos < stop:
+                self._pos = pos
+                return True
+            queue.pop(0)
+            self._pos = -1
+            if budget is not None and budget <= 0:
+                break
+        return bool(queue)
+
+    async def refresh(self, chunk=CHUNK):
+        # present the frame and send it from an asyncio task, yielding between chunks
+        import asyncio
+
+        self.present()
+        while self.pump(chunk):
+            await asyncio.sleep_ms(0)
+
+    def _changed(self, start, stop):
+        # spans of buffer[start:stop] that differ from the shadow frame,
+        # merging spans whose gap costs less than opening a new window
+        buf = self.buffer
+        shadow = self._shadow
+        if buf[start:stop] == shadow[start:stop]:
+            return ()
+        spans = []
+        first = -1
+        last = 0
+        for i in range(start, stop):
+            if buf[i] != shadow[i]:
+                if first < 0:
+                    first = i
+                elif i - last > WINDOW_COST:
+                    spans.append((first, last + 1))
+                    first = i
+                last = i
+        spans.append((first, last + 1))
+        return spans
+
+    def _queue_window(self, p0, p1, start, stop):
+        self._queue.append((p0, p1, start, stop))
+        if self._shadow is not None:
+            self._shadow[start:stop] = memoryview(self.buffer)[start:stop]
+        return stop - start
+
+    def write_window(self, x0, x1, p0, p1, buf):
+        cmds = self._window
+        cmds[1] = x0
+        cmds[2] = x1
+        cmds[4] = p0
+        cmds[5] = p1
+        self.write_cmds(cmds)
+        self.write_data(buf)
 
 
 class SSD1306_I2C(SSD1306):
-    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False):
+    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False, shadow=False, double_buffer=False, content_scroll=True):
         self.i2c = i2c
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
-        super().__init__(width, height, external_vcc)
+        self.cmd_list = [b"\x00", None]  # Co=0, D/C#=0
+        super().__init__(width, height, external_vcc, shadow, double_buffer, content_scroll)
 
     def write_cmd(self, cmd):
         self.temp[0] = 0x80  # Co=1, D/C#=0
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
 
+    def write_cmds(self, cmds):
+        # a command stream after a single Co=0 control byte
+        self.cmd_list[1] = cmds
+        self.i2c.writevto(self.addr, self.cmd_list)
+
     def write_data(self, buf):
         self.write_list[1] = buf
         self.i2c.writevto(self.addr, self.write_list)
 
 
+# SPI bus -> driver that last configured it, keyed by id(spi)
+_spi_owner = {}
+
+
+def spi_used(spi, owner=None):
+    # Record that another device has configured spi, so SSD1306_SPI
+    # reinitialises the bus before its next transfer.
+    _spi_owner[id(spi)] = owner
+
+
 class SSD1306_SPI(SSD1306):
-    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False):
+    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False, shadow=False, double_buffer=False, content_scroll=True):
         self.rate = 10 * 1024 * 1024
         dc.init(dc.OUT, value=0)
         res.init(res.OUT, value=0)
@@ -129,27 +535,55 @@ class SSD1306_SPI(SSD1306):
         self.dc = dc
         self.res = res
         self.cs = cs
-        import time
+        self.cmd = bytearray(1)
+        spi_used(spi)
 
         self.res(1)
         time.sleep_ms(1)
         self.res(0)
         time.sleep_ms(10)
         self.res(1)
-        super().__init__(width, height, external_vcc)
+        super().__init__(width, height, external_vcc, shadow, double_buffer, content_scroll)
+
+    def acquire(self):
+        # configure the bus only if another device has used it since
+        key = id(self.spi)
+        if _spi_owner.get(key) is not self:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+            _spi_owner[key] = self
 
     def write_cmd(self, cmd):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
-        self.cs(1)
+        self.cmd[0] = cmd
+        self.write_cmds(self.cmd)
+
+    def write_cmds(self, cmds):
+        self.acquire()
         self.dc(0)
         self.cs(0)
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(cmds)
         self.cs(1)
 
     def write_data(self, buf):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
-        self.cs(1)
+        self.acquire()
         self.dc(1)
         self.cs(0)
         self.spi.write(buf)
         self.cs(1)
+
+    def write_cmds_data(self, cmds, buf):
+        # commands then data in a single CS assertion, D/C# is sampled per byte
+        self.acquire()
+        self.dc(0)
+        self.cs(0)
+        self.spi.write(cmds)
+        self.dc(1)
+        self.spi.write(buf)
+        self.cs(1)
+
+    def write_window(self, x0, x1, p0, p1, buf):
+        cmds = self._window
+        cmds[1] = x0
+        cmds[2] = x1
+        cmds[4] = p0
+        cmds[5] = p1
+        self.write_cmds_data(cmds, buf)
@@ -1,7 +1,7 @@
 # Display Image & text on I2C driven ssd1306 OLED display 
 from machine import Pin, I2C, ADC
 from ssd1306 import SSD1306_I2C
-import framebuf
+from oled_layout import Layout
 import utime
 import sys
 from PiicoDev_ENS160 import PiicoDev_ENS160 # import the device driver
@@ -10,18 +10,11 @@ from PiicoDev_Unified import sleep_ms       # a cross-platform sleep function
 
 WIDTH  = 128                                            # oled display width
 HEIGHT = 64                                            # oled display height
-BUFFER_WIDTH = 4
 CHARACTER_WIDTH = 8
-CHARACTER_HEIGHT = 8
 
 sensor_temp = ADC(4)
 conversion_factor = 3.3 / (65535)
 
-#Create a framebuffer that can be used to clear text
-s = BUFFER_WIDTH * 8 * [0]
-blank_buffer = bytearray(s)
-blank_fb = framebuf.FrameBuffer(blank_buffer, BUFFER_WIDTH * CHARACTER_WIDTH, CHARACTER_WIDTH, framebuf.MONO_HLSB)
-
 RESET_PIN = Pin(22, Pin.OUT)
 print("Resetting OLED...",end='')
 RESET_PIN.value(False)
@@ -44,7 +37,7 @@ except OSError:
     print("EIO Error - Possible Address conflict")
     sys.exit()
 
-sensor = PiicoDev_ENS160(bus=0,scl=Pin(5), sda=Pin(4),freq=400000)   # Initialise the ENS160 module
+sensor = PiicoDev_ENS160(i2c=i2c)   # Initialise the ENS160 module on the same I2C bus
 
 
 
@@ -59,12 +52,19 @@ stat_str = 'Status: '
 oled.fill(0)
 oled.show()
 
-#template
-oled.text(aqi_str,0,20)
-oled.text(tvoc_str,0,30)
-oled.text(eco2_str,0,40)
-oled.text('  Temp: ',0,50)
-oled.text("*F",105,50)
+#template: labels are drawn once, values only where they change
+layout = Layout(oled)
+layout.label(aqi_str,0,20)
+layout.label(tvoc_str,0,30)
+layout.label(eco2_str,0,40)
+layout.label('  Temp: ',0,50)
+layout.label("*F",105,50)
+layout.field('status',0,8,WIDTH // CHARACTER_WIDTH)
+layout.field('aqi',65,20,5)
+layout.field('tvoc',65,30,5)
+layout.field('eco2',65,40,5)
+layout.field('temp',65,50,5)
+layout.draw()
 oled.show()
 
 
@@ -93,21 +93,9 @@ while True:
     print(stat_str + sensor.operation)
     print('  Temp: ' +str(round(fahrenheit_degrees,1)) + '°F')
     print('--------------------------------')
-    text_y = 8
-    oled.blit(blank_fb,0,text_y)
-    oled.blit(blank_fb,BUFFER_WIDTH*8,text_y)
-    oled.text(sensor.operation,0,8)
-    text_y = 20
-    oled.blit(blank_fb,65,text_y)
-    oled.text(str(aqi.value),65,text_y)
-    text_y = 30
-    oled.blit(blank_fb,65,text_y)
-    oled.text(str(tvoc),65,text_y)
-    text_y = 40
-    oled.blit(blank_fb,65,text_y)
-    oled.text(str(eco2.value),65,text_y)
-
-    text_y = 50
-    oled.blit(blank_fb,65,text_y)
-    oled.text(str(round(fahrenheit_degrees,1)),65,50)
+    layout.set('status',sensor.operation)
+    layout.set('aqi',aqi.value)
+    layout.set('tvoc',tvoc)
+    layout.set('eco2',eco2.value)
+    layout.set('temp',round(fahrenheit_degrees,1))
     utime.sleep(5)
\ No newline at end of file
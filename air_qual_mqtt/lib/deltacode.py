@@ -0,0 +1,104 @@
+# Compact integer series encoding for slowly changing sensor values:
+# each value is stored as the difference from the previous one, zigzag
+# mapped to an unsigned number (0, -1, 1, -2 ... -> 0, 1, 2, 3 ...) and
+# written as a LEB128 varint, 7 bits per byte. A steady eCO2 reading thus
+# costs one byte per sample instead of two, or five or so as text.
+#
+# With rle, a delta repeated r times (r >= 2) is written once with the
+# low bit of its token set, followed by varint r:
+#   series = varint count, then tokens
+#   token  = varint(zigzag(delta) << 1 | run), [varint repeat if run]
+# The first delta is taken from 0. Works the same on MicroPython and
+# CPython.
+
+
+def zigzag(n):
+    return n << 1 if n >= 0 else (-n << 1) - 1
+
+
+def unzigzag(z):
+    return z >> 1 if not z & 1 else -((z + 1) >> 1)
+
+
+def put_varint(out, n):
+    while n > 0x7F:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def get_varint(data, pos):
+    # (value, position after it)
+    n = shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+def encode(values, out=None, rle=True):
+    # append the encoded series to out (a new bytearray by default)
+    if out is None:
+        out = bytearray()
+    n = len(values)
+    put_varint(out, n)
+    prev = 0
+    i = 0
+    while i < n:
+        delta = values[i] - prev
+        prev = values[i]
+        i += 1
+        run = 1
+        if rle:
+            while i < n and values[i] - prev == delta:
+                prev = values[i]
+                i += 1
+                run += 1
+        if run > 1:
+            put_varint(out, zigzag(delta) << 1 | 1)
+            put_varint(out, run)
+        else:
+            put_varint(out, zigzag(delta) << 1)
+    return out
+
+
+def decode(data, pos=0, out=None):
+    # (values, position after the series); values are appended to out,
+    # a new list by default, e.g. an array('H') to keep them compact
+    if out is None:
+        out = []
+    n, pos = get_varint(data, pos)
+    value = 0
+    while n > 0:
+        token, pos = get_varint(data, pos)
+        delta = unzigzag(token >> 1)
+        run = 1
+        if token & 1:
+            run, pos = get_varint(data, pos)
+        for _ in range(run):
+            value += delta
+            out.append(value)
+        n -= run
+    return out, pos
+
+
+def encode_columns(columns, out=None, rle=True):
+    # several series of equal length, e.g. the aqi, tvoc, eco2 and temp
+    # columns of a batch of samples, one after the other
+    if out is None:
+        out = bytearray()
+    for column in columns:
+        encode(column, out, rle)
+    return out
+
+
+def decode_columns(data, count, pos=0):
+    # (list of count series, position after them)
+    columns = []
+    for _ in range(count):
+        column, pos = decode(data, pos)
+        columns.append(column)
+    return columns, pos
@@ -0,0 +1,103 @@
+# Non-blocking DS18B20 sampling for every sensor on a OneWire bus: one
+# Skip ROM convert starts a conversion on all of them, and once the
+# conversion time for the configured resolution has passed on the main
+# loop's tick clock the scratchpads are read in one pass. The loop never
+# sleeps through a conversion, and each sensor's reading from the last
+# pass is cached between conversions, None if that sensor failed it.
+
+import utime
+
+FAMILY_DS18B20 = 0x28
+FAMILY_DS1822 = 0x22
+
+# conversion time per resolution in bits, 93.75 ms doubling per bit
+CONVERSION_MS = {9: 94, 10: 188, 11: 375, 12: 750}
+
+
+def config_byte(resolution):
+    # scratchpad configuration register for 9..12 bit resolution
+    return (resolution - 9) << 5 | 0x1F
+
+
+class DSBus:
+    def __init__(self, ds, roms=None, resolution=12, period_ms=10000):
+        # ds is a ds18x20.DS18X20; roms defaults to every DS18B20/DS1822
+        # found by a bus scan
+        if resolution not in CONVERSION_MS:
+            raise ValueError("resolution must be 9 to 12 bits")
+        self.ds = ds
+        if roms is None:
+            roms = [rom for rom in ds.scan() if rom[0] in (FAMILY_DS18B20, FAMILY_DS1822)]
+        self.roms = roms
+        self.resolution = resolution
+        self.conversion_ms = CONVERSION_MS[resolution]
+        self.period_ms = period_ms
+        self.values = [None] * len(roms)  # reading per sensor from the last pass, degrees C
+        self.read_at = None  # ticks_ms of the last pass
+        self.errors = 0
+        self._started = None  # ticks_ms of the pending conversion
+        self._mask = ~((1 << (12 - resolution)) - 1)  # bits undefined at this resolution
+        for rom in roms:
+            self.set_resolution(rom, resolution)
+
+    def set_resolution(self, rom, resolution):
+        # keep the alarm registers, only write the configuration byte
+        scratch = self.ds.read_scratch(rom)
+        if scratch[4] != config_byte(resolution):
+            self.ds.write_scratch(rom, bytes((scratch[2], scratch[3], config_byte(resolution))))
+
+    def __len__(self):
+        return len(self.roms)
+
+    @property
+    def value(self):
+        # the first sensor's reading, the one used on the display
+        return self.values[0] if self.values else None
+
+    @property
+    def busy(self):
+        return self._started is not None
+
+    def start(self, now):
+        # Skip ROM convert for every sensor; returns at once
+        self.ds.convert_temp()
+        self._started = now
+
+    def collect(self, now):
+        # Read every scratchpad if the conversion time is up. A sensor that
+        # fails the read gets None. Returns True if all sensors gave a
+        # valid reading.
+        if self._started is None or utime.ticks_diff(now, self._started) < self.conversion_ms:
+            return False
+        self._started = None
+        ok = True
+        for i, rom in enumerate(self.roms):
+            try:
+                scratch = self.ds.read_scratch(rom)
+            except Exception:  # CRC error or no presence pulse
+                self.errors += 1
+                self.values[i] = None  # no stale reading passed off as current
+                ok = False
+                continue
+            t = (scratch[1] << 8 | scratch[0]) & self._mask
+            if t & 0x8000:
+                t -= 0x10000
+            self.values[i] = t / 16
+        # the pass counts even if a sensor failed, so that a dead sensor
+        # does not keep the bus converting back to back
+        self.read_at = now
+        return ok
+
+    def poll(self, now):
+        # Call every pass of the main loop: collects a finished conversion
+        # and starts the next one once period_ms has passed since the last
+        # pass. Returns the first sensor's cached value.
+        if self._started is not None:
+            self.collect(now)
+        elif self.read_at is None or utime.ticks_diff(now, self.read_at) >= self.period_ms:
+            self.start(now)
+        return self.value
+
+    def age(self, now):
+        # ms since the last pass, None without one
+        return None if self.read_at is None else utime.ticks_diff(now, self.read_at)
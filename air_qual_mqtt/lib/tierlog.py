@@ -0,0 +1,323 @@
+# Sensor history on flash at several resolutions: raw samples plus
+# min/max/mean buckets (1 min, 15 min and 1 h by default), each tier a
+# fixed-record binary append log.
+#
+# Records, little endian, times in seconds from time.time(), temperatures
+# in tenths of a degree:
+#   raw tier (period 0), 16 bytes:
+#     time u32, aqi u16, tvoc u16, eco2 u16, temp i16, 4 pad bytes
+#   bucket tiers, 32 bytes:
+#     bucket start u32, count u16, aqi min/max/mean u16,
+#     tvoc min/max/mean u16, eco2 min/max/mean u16,
+#     temp min/max/mean i16, 2 pad bytes
+#
+# Records are collected in a block-sized RAM buffer and only whole blocks
+# are appended, so each flash write is one aligned block and files stay
+# a multiple of the block size; a crash loses at most the unwritten
+# block. Bucket tiers with a period of SYNC_PERIOD or more write each
+# bucket as it closes instead, and the owner calls flush() periodically
+# and before a planned reset to bound what the finer tiers can lose.
+# After a flush the next write only fills up to the block boundary. When
+# a file reaches its size limit it is renamed to <name>.old (replacing
+# the previous one) and a new file is started, so a tier holds between
+# one and two limits of history. A file ending in a partial record after
+# an interrupted write is cut back to its whole records when opened.
+#
+# Times must not decrease within a tier: a sample older than the last
+# one logged (e.g. from a clock not yet set by NTP) is dropped.
+#
+# Each data file has a sparse index side file, <file>.idx, with one
+# (first record time u32, byte offset u32) entry per written block. Range
+# queries binary-search it, assuming times never decrease within a file,
+# and read from the block that can hold the first match until the first
+# record past the range. Index entries missing after a crash are rebuilt
+# from the data file when it is opened.
+
+import os
+import struct
+from array import array
+
+RAW_FMT = "<IHHHh4x"
+BUCKET_FMT = "<IH9H3h2x"
+RAW_SIZE = struct.calcsize(RAW_FMT)
+BUCKET_SIZE = struct.calcsize(BUCKET_FMT)
+
+# (period in seconds, file size limit in bytes); period 0 is the raw tier
+TIERS = ((0, 65536), (60, 32768), (900, 16384), (3600, 16384))
+BLOCK = 512
+SYNC_PERIOD = 900  # bucket tiers this coarse write every closed bucket
+
+_N = 4  # aqi, tvoc, eco2, temp
+_ENTRY = "<II"
+_ENTRY_SIZE = 8
+
+
+def _exists(path):
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+
+def _size(path):
+    try:
+        return os.stat(path)[6]
+    except OSError:
+        return 0
+
+
+class Tier:
+    def __init__(self, directory, period, max_bytes, block):
+        self.period = period
+        self.max_bytes = max_bytes
+        self.path = "{}/tier{}.bin".format(directory, period)
+        self.old = self.path[:-4] + ".old"
+        self.fmt = RAW_FMT if period == 0 else BUCKET_FMT
+        self.record = RAW_SIZE if period == 0 else BUCKET_SIZE
+        self.block = block - block % self.record
+        self.buf = bytearray(self.block)
+        self.used = 0  # bytes of buf holding records
+        self.size = _size(self.path)
+        if self.size % self.record:
+            self._repair()
+        self.index = self._load_index(self.path, self.size)
+        self.old_index = self._load_index(self.old, _size(self.old))
+        # time of the last record on flash, later samples must not be older
+        self.last = self._last_time(self.path, self.size)
+        if self.last is None:
+            self.last = self._last_time(self.old, _size(self.old))
+        self.dropped = 0  # samples older than the last one
+        # bucket being accumulated: start, count, then min, max, sum per value
+        self.start = None
+        self.count = 0
+        self.low = [0] * _N
+        self.high = [0] * _N
+        self.total = [0] * _N
+
+    def _repair(self):
+        # Copy the whole records of a file with a torn last record to a
+        # new file and rename it over the damaged one; .old is left alone.
+        end = self.size - self.size % self.record
+        tmp = self.path + ".tmp"
+        buf = self.buf
+        with open(self.path, "rb") as src, open(tmp, "wb") as dst:
+            pos = 0
+            while pos < end:
+                n = src.readinto(buf)
+                if not n:
+                    break
+                n = min(n, end - pos)
+                dst.write(memoryview(buf)[:n])
+                pos += n
+        os.rename(tmp, self.path)
+        self.size = end
+
+    def _last_time(self, path, size):
+        if size < self.record:
+            return None
+        with open(path, "rb") as f:
+            f.seek(size - size % self.record - self.record)
+            return struct.unpack("<I", f.read(4))[0]
+
+    def rotate(self):
+        # rename is atomic on littlefs: at any point either the old or the
+        # current file (or both) is complete; a missing index is rebuilt
+        for path in (self.old + ".idx", self.old):
+            if _exists(path):
+                os.remove(path)
+        for path in (self.path + ".idx", self.path):
+            if _exists(path):
+                os.rename(path, path.replace(self.path, self.old))
+        self.old_index = self._load_index(self.old, _size(self.old))
+        self.index = (array("L"), array("L"))
+        self.size = 0
+
+    def _load_index(self, path, size):
+        # (first times, offsets) of a data file from its side file, which
+        # is rewritten if it misses blocks or lists ones that do not exist
+        times, offsets = array("L"), array("L")
+        entry = bytearray(_ENTRY_SIZE)
+        stale = False
+        try:
+            with open(path + ".idx", "rb") as f:
+                while f.readinto(entry) == _ENTRY_SIZE:
+                    t, offset = struct.unpack(_ENTRY, entry)
+                    if offset >= size or (offsets and offset <= offsets[-1]):
+                        stale = True
+                        break
+                    times.append(t)
+                    offsets.append(offset)
+        except OSError:
+            pass
+        end = size - size % self.record
+        offset = offsets[-1] + self.block if offsets else 0
+        if offset < end:
+            stale = True
+            with open(path, "rb") as f:
+                while offset < end:
+                    f.seek(offset)
+                    f.readinto(entry)
+                    times.append(struct.unpack_from("<I", entry)[0])
+                    offsets.append(offset)
+                    offset += self.block
+        if stale:
+            with open(path + ".idx", "wb") as f:
+                for i in range(len(times)):
+                    f.write(struct.pack(_ENTRY, times[i], offsets[i]))
+        return times, offsets
+
+    def _append(self, *values):
+        struct.pack_into(self.fmt, self.buf, self.used, *values)
+        self.used += self.record
+        if self.used >= self.block - self.size % self.block:
+            self.flush()
+
+    def flush(self):
+        # append the buffered records; from _append() this is exactly the
+        # rest of the current block
+        if not self.used:
+            return
+        if self.size + self.used > self.max_bytes:
+            self.rotate()
+        with open(self.path, "ab") as f:
+            f.write(memoryview(self.buf)[:self.used])
+        t = struct.unpack_from("<I", self.buf)[0]
+        with open(self.path + ".idx", "ab") as f:
+            f.write(struct.pack(_ENTRY, t, self.size))
+        self.index[0].append(t)
+        self.index[1].append(self.size)
+        self.size += self.used
+        self.used = 0
+
+    def add(self, t, values):
+        if self.last is not None and t < self.last:
+            self.dropped += 1  # would break the time order scan() relies on
+            return
+        self.last = t
+        if self.period == 0:
+            self._append(t, *values)
+            return
+        start = t - t % self.period
+        if start != self.start:
+            self.emit()
+            if self.period >= SYNC_PERIOD:
+                self.flush()
+            self.start = start
+        low, high, total = self.low, self.high, self.total
+        for i in range(_N):
+            v = values[i]
+            if not self.count or v < low[i]:
+                low[i] = v
+            if not self.count or v > high[i]:
+                high[i] = v
+            total[i] = total[i] + v if self.count else v
+        self.count += 1
+
+    def emit(self):
+        # write the bucket being accumulated, if any
+        if not self.count:
+            return
+        n = self.count
+        low, high, total = self.low, self.high, self.total
+        self._append(self.start, n,
+                     low[0], high[0], total[0] // n,
+                     low[1], high[1], total[1] // n,
+                     low[2], high[2], total[2] // n,
+                     low[3], high[3], int(round(total[3] / n)))
+        self.count = 0
+
+    def scan(self, t0, t1, buf):
+        # Offsets into buf of the records with t0 <= time < t1, oldest
+        # first. buf is a reusable read buffer of whole records; each record
+        # is valid until the generator is resumed.
+        size = self.record
+        unpack_from = struct.unpack_from
+        for path, (times, offsets) in ((self.old, self.old_index), (self.path, self.index)):
+            if not offsets or times[0] >= t1:
+                continue
+            # last block starting before t0 holds the first match, if any
+            lo, hi = 0, len(times)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if times[mid] < t0:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            with open(path, "rb") as f:
+                f.seek(offsets[lo - 1] if lo else 0)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    for offset in range(0, n - n % size, size):
+                        t = unpack_from("<I", buf, offset)[0]
+                        if t >= t1:
+                            return
+                        if t >= t0:
+                            yield offset
+        # buffered records are copied out, buf is the caller's
+        for offset in range(0, self.used, size):
+            t = unpack_from("<I", self.buf, offset)[0]
+            if t >= t1:
+                return
+            if t >= t0:
+                buf[:size] = self.buf[offset:offset + size]
+                yield 0
+
+    def records(self, t0, t1, buf):
+        # the records of scan() unpacked into tuples
+        fmt = self.fmt
+        for offset in self.scan(t0, t1, buf):
+            yield struct.unpack_from(fmt, buf, offset)
+
+
+class TierLog:
+    def __init__(self, directory="log", tiers=TIERS, block=BLOCK):
+        try:
+            os.mkdir(directory)
+        except OSError:
+            pass  # already there
+        self.tiers = [Tier(directory, period, max_bytes, block) for period, max_bytes in tiers]
+        self._read = bytearray(block - block % BUCKET_SIZE)  # whole records of either size
+
+    def append(self, t, aqi, tvoc, eco2, temp):
+        # temp in degrees, stored in tenths
+        values = (aqi, tvoc, eco2, int(round(temp * 10)))
+        for tier in self.tiers:
+            tier.add(t, values)
+
+    def flush(self, buckets=True):
+        # Write out every tier's buffered records, and with buckets the
+        # open buckets too, e.g. before a planned reset; a bucket continued
+        # afterwards is written again as a second record with the same
+        # start time. Periodic flushes pass buckets=False.
+        for tier in self.tiers:
+            if buckets:
+                tier.emit()
+            tier.flush()
+
+    def tier_for(self, resolution):
+        # the coarsest tier whose period is not longer than resolution
+        best = self.tiers[0]
+        for tier in self.tiers:
+            if best.period < tier.period <= resolution:
+                best = tier
+        return best
+
+    def query(self, t0, t1, resolution=0):
+        # Records with t0 <= time < t1 from the coarsest tier with a period
+        # of at most resolution seconds, oldest first. Raw records are
+        # (time, aqi, tvoc, eco2, temp), bucket records (start, count,
+        # aqi min, max, mean, tvoc ..., eco2 ..., temp ...); temperatures
+        # in tenths. The bucket still being accumulated is not included.
+        tier = self.tier_for(resolution)
+        return tier.records(t0, t1, self._read)
+
+    def scan(self, t0, t1, resolution=0):
+        # query() without unpacking: yields (buf, offset) of each record
+        # in a shared read buffer, valid until the next one; decode it
+        # with struct.unpack_from(tier_for(resolution).fmt, buf, offset)
+        buf = self._read
+        for offset in self.tier_for(resolution).scan(t0, t1, buf):
+            yield buf, offset
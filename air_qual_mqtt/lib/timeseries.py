@@ -0,0 +1,141 @@
+# Fixed-capacity sensor history: one array-backed ring per quantity with
+# tick timestamps, and rolling min/max/mean/EMA over the ring kept up to
+# date on every push, so reading a statistic never rescans the history.
+#
+# min/max use monotonic deques of ring positions (amortised O(1) per
+# push), the mean a running total and the EMA integer fixed point with
+# alpha = 1 / 2**ema_shift. Pushing an integer into a series with scale 1
+# does not allocate.
+
+from array import array
+
+_EMA_FRAC = 8  # fractional bits of the EMA accumulator
+
+
+class _Deque:
+    # ring positions with monotonic values, front is the current extreme
+    def __init__(self, size):
+        self.pos = array('H', [0] * size)
+        self.front = 0
+        self.n = 0
+
+    def push(self, values, p, lowest):
+        # drop positions from the back whose values p's value beats, then
+        # append p; lowest selects a min (True) or max (False) deque
+        pos = self.pos
+        size = len(pos)
+        n = self.n
+        v = values[p]
+        back = (self.front + n - 1) % size
+        if lowest:
+            while n and values[pos[back]] >= v:
+                n -= 1
+                back = (back - 1) % size
+        else:
+            while n and values[pos[back]] <= v:
+                n -= 1
+                back = (back - 1) % size
+        pos[(back + 1) % size] = p
+        self.n = n + 1
+
+    def expire(self, p):
+        # p is about to be overwritten, drop it if it is the front
+        if self.n and self.pos[self.front] == p:
+            self.front = (self.front + 1) % len(self.pos)
+            self.n -= 1
+
+
+class Series:
+    # typecode 'H' or 'h'; values are stored as round(value * scale)
+    def __init__(self, size, typecode='H', scale=1, ema_shift=3):
+        self.size = size
+        self.scale = scale
+        self.values = array(typecode, [0] * size)
+        self.head = 0  # next slot to write
+        self.count = 0
+        self._total = 0
+        self._ema = 0
+        self._ema_shift = ema_shift
+        self._min = _Deque(size)
+        self._max = _Deque(size)
+
+    def __len__(self):
+        return self.count
+
+    def push(self, value):
+        v = int(round(value * self.scale)) if self.scale != 1 else value
+        p = self.head
+        if self.count == self.size:
+            self._total -= self.values[p]
+            self._min.expire(p)
+            self._max.expire(p)
+        else:
+            self.count += 1
+        self.values[p] = v
+        self._total += v
+        self._min.push(self.values, p, True)
+        self._max.push(self.values, p, False)
+        if self.count == 1:
+            self._ema = v << _EMA_FRAC
+        else:
+            self._ema += ((v << _EMA_FRAC) - self._ema) >> self._ema_shift
+        self.head = (p + 1) % self.size
+
+    def _scaled(self, v):
+        return v / self.scale if self.scale != 1 else v
+
+    @property
+    def last(self):
+        if not self.count:
+            return None
+        return self._scaled(self.values[(self.head - 1) % self.size])
+
+    @property
+    def min(self):
+        return self._scaled(self.values[self._min.pos[self._min.front]]) if self.count else None
+
+    @property
+    def max(self):
+        return self._scaled(self.values[self._max.pos[self._max.front]]) if self.count else None
+
+    @property
+    def mean(self):
+        return self._total / self.count / self.scale if self.count else None
+
+    @property
+    def ema(self):
+        return self._ema / (1 << _EMA_FRAC) / self.scale if self.count else None
+
+    def __iter__(self):
+        # stored values, oldest first
+        for i in range(self.head - self.count, self.head):
+            yield self._scaled(self.values[i % self.size])
+
+
+class History:
+    # the last size samples of the air quality sensor and temperature
+    def __init__(self, size, ema_shift=3):
+        self.size = size
+        self.ticks = array('l', [0] * size)
+        self.aqi = Series(size, 'H', ema_shift=ema_shift)
+        self.tvoc = Series(size, 'H', ema_shift=ema_shift)
+        self.eco2 = Series(size, 'H', ema_shift=ema_shift)
+        self.temp = Series(size, 'h', scale=10, ema_shift=ema_shift)  # 0.1 degree steps
+
+    def __len__(self):
+        return len(self.aqi)
+
+    def push(self, ticks, aqi, tvoc, eco2, temp):
+        self.ticks[self.aqi.head] = ticks
+        self.aqi.push(aqi)
+        self.tvoc.push(tvoc)
+        self.eco2.push(eco2)
+        self.temp.push(temp)
+
+    def __iter__(self):
+        # (ticks, aqi, tvoc, eco2, temp) tuples, oldest first
+        series = (self.aqi, self.tvoc, self.eco2, self.temp)
+        head = self.aqi.head
+        for i in range(head - len(self), head):
+            i %= self.size
+            yield (self.ticks[i],) + tuple(s._scaled(s.values[i]) for s in series)
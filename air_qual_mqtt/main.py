@@ -1,14 +1,19 @@
-from machine import Pin, I2C, ADC, WDT, reset
+from machine import Pin, ADC, WDT, Timer, reset
 from micropython import const
 import network
+import ntptime
 import utime
 import sys
-import framebuf
+import json
 
 from ssd1306 import SSD1306_I2C
+from oled_layout import Layout
+from timeseries import History
+from tierlog import TierLog
+from dstemp import DSBus
 import onewire, ds18x20
 from PiicoDev_ENS160 import PiicoDev_ENS160
-from PiicoDev_Unified import sleep_ms
+from PiicoDev_Unified import create_unified_i2c, instrument, sleep_ms
 from umqtt.simple import MQTTClient
 from secrets import ap, pw, mqtt_user, mqtt_pw
 
@@ -22,13 +27,21 @@ REFRESH_SECONDS = const(10)
 DISP_ON_TIME_TICKS = const(3000)
 DISP_OFF_TIME_TICKS = const(10_000)
 ANIMATION_TIME_TICKS = const(5000)
+DISPLAY_PUMP_MS = const(5)
+DS_PERIOD_MS = const(10_000)  # DS18B20 conversions, started from the main loop
+DS_RESOLUTION = const(12)  # bits, 9 (94 ms conversion) to 12 (750 ms)
+HISTORY_SIZE = const(360)  # samples kept for trends, one per SHOW_SENSOR cycle
+LOG_FLUSH_MS = const(600_000)  # write the flash log's buffered records this often
+I2C_STATS = False  # count I2C traffic per device and publish it to MQTT_TOPICS['i2c']
+I2C_STATS_PERIOD_MS = const(60_000)
 
 MQTT_SERVER = '192.168.1.131'
 MQTT_PORT = 1883
 MQTT_TOPICS = {
     "aqi": b'home-assistant/livingroom/aqi',
     "eco2": b'home-assistant/livingroom/eco2',
-    "tvoc": b'home-assistant/livingroom/tvoc'
+    "tvoc": b'home-assistant/livingroom/tvoc',
+    "i2c": b'home-assistant/livingroom/i2c'
 }
 
 class DisplayState:
@@ -47,10 +60,6 @@ I2C0_BUS = const(0)
 # === Global Sensor Setup ===
 sensor_temp = ADC(4)
 VOLTAGE_CONVERSION = 3.3 / 65535
-#blank_fb = framebuf.FrameBuffer(bytearray(BUFFER_WIDTH * 8), BUFFER_WIDTH * CHAR_WIDTH, CHAR_HEIGHT, framebuf.MONO_HLSB)
-# Create a framebuffer to blank a 128x8 area of the display
-blank_buffer = bytearray(128 * 8 // 8)  # 128 pixels wide × 8 pixels high ÷ 8 bits/byte
-blank_fb = framebuf.FrameBuffer(blank_buffer, 128, 8, framebuf.MONO_HLSB)
 
 # === Utility Functions ===
 
@@ -64,30 +73,13 @@ def average_temp_f():
 def celsius_to_fahrenheit(temp_c):
     return temp_c * 9 / 5 + 32
 
-def read_ds18b20_temp(ds, ds_rom):
-    """
-    Initiates a temperature conversion and reads the temperature
-    from a DS18B20 sensor.
-
-    Args:
-        ds (DS18X20): The DS18X20 temperature sensor object.
-        ds_rom (bytearray): The ROM code of the sensor.
-
-    Returns:
-        float: The temperature in Celsius.
-    """
-    ds.convert_temp()
-    utime.sleep_ms(750)  # Wait for conversion to complete
-    temp_c = ds.read_temp(ds_rom)
-    return temp_c
-
 def init_i2c_display(i2c):
     """Initialize SSD1306 OLED display."""
     addr = i2c.scan()[0]
     print(f"I2C Address: {hex(addr).upper()}")
 
     try:
-        oled = SSD1306_I2C(WIDTH, HEIGHT, i2c, addr=addr, external_vcc=False)
+        oled = SSD1306_I2C(WIDTH, HEIGHT, i2c, addr=addr, external_vcc=False, shadow=True, double_buffer=True)
         oled.text("Display...OK", 0, 10)
         oled.show()
         return oled
@@ -95,10 +87,10 @@ def init_i2c_display(i2c):
         print("SSD1306 EIO Error - Possible Address conflict")
         sys.exit()
 
-def init_ens160_sensor():
-    """Initialize ENS160 sensor."""
+def init_ens160_sensor(i2c):
+    """Initialize ENS160 sensor on the shared I2C bus."""
     try:
-        return PiicoDev_ENS160(bus=I2C0_BUS, scl=I2C0_SCL, sda=I2C0_SDA, freq=I2C0_FREQ)
+        return PiicoDev_ENS160(i2c=i2c)
     except OSError:
         print("ENS160 EIO Error - Possible Address conflict")
         sys.exit()
@@ -121,6 +113,10 @@ def connect_wifi(oled):
     
     ip = wlan.ifconfig()[0]
     print(f"Connected. IP: {ip}")
+    try:
+        ntptime.settime()  # wall clock for the flash log
+    except Exception as e:
+        print("NTP failed:", e)
     oled.text("WIFI...OK", 0, 40)
     oled.show()
     utime.sleep(2)
@@ -136,34 +132,38 @@ def init_system():
     utime.sleep(0.25)
     reset_pin.value(True)
 
-    i2c = I2C(I2C0_BUS, scl=I2C0_SCL, sda=I2C0_SDA, freq=I2C0_FREQ)
+    # one handle for the OLED and the ENS160, the peripheral is set up once
+    i2c = instrument(create_unified_i2c(bus=I2C0_BUS, freq=I2C0_FREQ, sda=I2C0_SDA, scl=I2C0_SCL), I2C_STATS)
     oled = init_i2c_display(i2c)
-    sensor = init_ens160_sensor()
+    sensor = init_ens160_sensor(i2c)
     oled.text("Sensor...OK", 0, 20)
     oled.show()
 
     # Setup OneWire sensor (DS18B20)
     try:
         ow = onewire.OneWire(Pin(22))  # create a OneWire bus on GPIO22
-        roms = ow.scan()
-        if not roms:
+        ds_bus = DSBus(ds18x20.DS18X20(ow), resolution=DS_RESOLUTION, period_ms=DS_PERIOD_MS)
+        if not len(ds_bus):
             raise Exception("No DS18B20 sensor found")
-        ds = ds18x20.DS18X20(ow)
-        ds_rom = roms[0]
+        print(f"{len(ds_bus)} DS18B20 sensor(s) at {DS_RESOLUTION} bit")
         oled.text("DS18B20...OK", 0, 30)
         oled.show()
     except Exception as e:
         oled.text("DS18B20...FAIL", 0, 30)
         oled.show()
         print("DS18B20 Error:", e)
-        ds = None
-        ds_rom = None
+        ds_bus = None
 
     ip = connect_wifi(oled)
 
-    return oled, sensor, ds_rom, ds, ip
+    return oled, sensor, ds_bus, ip, i2c
 
-def mqtt_connect():
+def restart(tierlog):
+    """Write out the flash log, then reset the board."""
+    tierlog.flush()
+    reset()
+
+def mqtt_connect(tierlog):
     """Connect to MQTT broker and return client."""
     try:
         client = MQTTClient('', MQTT_SERVER, MQTT_PORT, mqtt_user, mqtt_pw, keepalive=3600)
@@ -173,13 +173,33 @@ def mqtt_connect():
     except Exception as e:
         print("MQTT connection failed. Rebooting...")
         utime.sleep(5)
-        reset()
-
-def display_sensor_data(oled, sensor, temp_f):
-    """Display sensor readings on the OLED screen."""
+        restart(tierlog)
+
+def sensor_layout(oled):
+    """Static labels and value fields of the sensor screen."""
+    layout = Layout(oled)
+    layout.label(" AQI:", 0, 20)
+    layout.label("TVOC:", 0, 30)
+    layout.label("eCO2:", 0, 40)
+    layout.label("Temp:", 0, 50)
+    layout.label("o", 88, 45)
+    layout.label("F", 96, 50)
+    layout.field("status", 0, 8, WIDTH // CHAR_WIDTH)
+    layout.field("aqi", 48, 20, 5)
+    layout.field("tvoc", 48, 30, 5)
+    layout.field("eco2", 48, 40, 5)
+    layout.field("temp", 48, 50, 5)
+    layout.field("trend", 96, 40, 1)
+    return layout
+
+def display_sensor_data(oled, layout, sensor, temp_f, history):
+    """Display sensor readings on the OLED screen and add them to the history."""
     oled.contrast(64)  # Default is 255. Lower = dimmer
     oled.fill(0)
+    layout.draw()
 
+    # one burst read; the properties below are views of this sample
+    sensor.read_all()
     aqi = sensor.aqi
     tvoc = sensor.tvoc
     eco2 = sensor.eco2
@@ -190,28 +210,38 @@ def display_sensor_data(oled, sensor, temp_f):
     print(f"  eCO2: {eco2.value} ppm [{eco2.rating}]")
     print(f"Status: {operation}")
     print(f"  Temp: {str(round(temp_f,1))}°F")
+
+    trend = ""
+    if eco2.value is not None:
+        history.push(utime.ticks_ms(), aqi.value, tvoc, eco2.value, temp_f)
+        # eCO2 against its moving average
+        ema = history.eco2.ema
+        trend = "^" if eco2.value > ema + 0.5 else "v" if eco2.value < ema - 0.5 else "="
+        print(f"  eCO2 last {len(history)}: min {history.eco2.min} mean {round(history.eco2.mean)} max {history.eco2.max} ppm")
     print("-" * 32)
 
-    # Clear lines
-    for y in [8, 20, 30, 40, 50]:
-        oled.blit(blank_fb, 0, y)
-
-    # Display updated text
-    oled.text(f"{operation}", 0, 8)
-    oled.text(f" AQI: {aqi.value}", 0, 20)
-    oled.text(f"TVOC: {tvoc}", 0, 30)
-    oled.text(f"eCO2: {eco2.value}", 0, 40)
-    oled.text(f"Temp: {round(temp_f,1)}  F", 0, 50)
-    oled.text("o", 88, 45)
-    oled.show()
+    layout.set("status", operation)
+    layout.set("aqi", aqi.value)
+    layout.set("tvoc", tvoc)
+    layout.set("eco2", eco2.value)
+    layout.set("temp", round(temp_f, 1))
+    layout.set("trend", trend)
+    oled.present()
+    return sensor.sample
 
 
 # === Main Program ===
 
 def main():
-    oled, sensor, ds_rom, ds, ip = init_system()
-    mqtt_client = mqtt_connect()
+    oled, sensor, ds_bus, ip, i2c = init_system()
+    tierlog = TierLog()
+    mqtt_client = mqtt_connect(tierlog)
+    layout = sensor_layout(oled)
+    history = History(HISTORY_SIZE)
+    sensor_visit = None  # state_start_time of the SHOW_SENSOR visit already sampled
     wdt = WDT(timeout=5000)
+    # Send presented frames in small chunks between main loop work
+    Timer(period=DISPLAY_PUMP_MS, mode=Timer.PERIODIC, callback=lambda t: oled.pump())
 
     spinner_index = 0  # initialize before the loop
     last_frame_time = utime.ticks_ms()
@@ -224,104 +254,125 @@ def main():
 
     state = DisplayState.SHOW_SENSOR
     state_start_time = utime.ticks_ms()
+    i2c_stats_time = state_start_time
+    log_flush_time = state_start_time
 
-    while True:
-        now = utime.ticks_ms()
-        elapsed = utime.ticks_diff(now, state_start_time)
-
-        # === State Machine ===
-        if state == DisplayState.SHOW_IP:
-            if elapsed < 100:
-                oled.poweron()
-                oled.fill(0)
-                oled.text("IP Address:", 0, 20)
-                oled.text(ip, 0, 35)
-                oled.show()
-            elif elapsed > DISP_ON_TIME_TICKS:
-                state = DisplayState.ANIMATION2
-                state_start_time = now
-
-        elif state == DisplayState.SHOW_SENSOR:
-            if elapsed < 100:
-                oled.poweron()
-                if ds and ds_rom:
-                    temp_c = read_ds18b20_temp(ds, ds_rom)
-                else:
-                    temp_c = (average_temp_f() - 32) * 5 / 9
-                temp_f = celsius_to_fahrenheit(temp_c)
-                sensor.temperature = temp_c
-                display_sensor_data(oled, sensor, temp_f)
-
-                mqtt_client.publish(MQTT_TOPICS['aqi'], str(sensor.aqi.value))
-                mqtt_client.publish(MQTT_TOPICS['tvoc'], str(sensor.tvoc))
-                mqtt_client.publish(MQTT_TOPICS['eco2'], str(sensor.eco2.value))
-
-            elif elapsed > DISP_ON_TIME_TICKS:
-                state = DisplayState.SHOW_IP
-                state_start_time = now
-
-        elif state == DisplayState.DISPLAY_OFF:
-            if elapsed < 100:
-                oled.poweroff()
-            elif elapsed > DISP_OFF_TIME_TICKS:
-                state = DisplayState.SHOW_IP
-                state_start_time = now
-
-        elif state == DisplayState.ANIMATION1:
-            if elapsed < 100:
-                oled.poweron()
-                oled.fill(0)
-                oled.text("Loading", 0, 20)
-                oled.show()
+    try:
+        while True:
+            now = utime.ticks_ms()
+            elapsed = utime.ticks_diff(now, state_start_time)
+            if ds_bus:
+                ds_bus.poll(now)  # start or collect a conversion, never waits
+            if I2C_STATS and utime.ticks_diff(now, i2c_stats_time) >= I2C_STATS_PERIOD_MS:
+                # traffic per device since the last snapshot
+                mqtt_client.publish(MQTT_TOPICS['i2c'], json.dumps(i2c.stats()))
+                i2c.reset()
+                i2c_stats_time = now
+            if utime.ticks_diff(now, log_flush_time) >= LOG_FLUSH_MS:
+                tierlog.flush(False)  # closed records only, open buckets stay in RAM
+                log_flush_time = now
+
+            # === State Machine ===
+            if state == DisplayState.SHOW_IP:
+                if elapsed < 100:
+                    oled.poweron()
+                    oled.fill(0)
+                    oled.text("IP Address:", 0, 20)
+                    oled.text(ip, 0, 35)
+                    oled.present()
+                elif elapsed > DISP_ON_TIME_TICKS:
+                    state = DisplayState.ANIMATION2
+                    state_start_time = now
+
+            elif state == DisplayState.SHOW_SENSOR:
+                if elapsed < 100 and sensor_visit != state_start_time:
+                    sensor_visit = state_start_time  # once per visit
+                    oled.poweron()
+                    if ds_bus and ds_bus.value is not None:
+                        temp_c = ds_bus.value
+                    else:
+                        temp_c = (average_temp_f() - 32) * 5 / 9
+                    temp_f = celsius_to_fahrenheit(temp_c)
+                    sensor.temperature = temp_c
+                    sample = display_sensor_data(oled, layout, sensor, temp_f, history)
+                    if sample.aqi is not None:
+                        tierlog.append(utime.time(), sample.aqi, sample.tvoc, sample.eco2, temp_f)
+
+                    # publish the same measurement that was displayed
+                    mqtt_client.publish(MQTT_TOPICS['aqi'], str(sample.aqi))
+                    mqtt_client.publish(MQTT_TOPICS['tvoc'], str(sample.tvoc))
+                    mqtt_client.publish(MQTT_TOPICS['eco2'], str(sample.eco2))
+
+                elif elapsed > DISP_ON_TIME_TICKS:
+                    state = DisplayState.SHOW_IP
+                    state_start_time = now
+
+            elif state == DisplayState.DISPLAY_OFF:
+                if elapsed < 100:
+                    oled.poweroff()
+                elif elapsed > DISP_OFF_TIME_TICKS:
+                    state = DisplayState.SHOW_IP
+                    state_start_time = now
+
+            elif state == DisplayState.ANIMATION1:
+                if elapsed < 100:
+                    oled.poweron()
+                    oled.fill(0)
+                    oled.text("Loading", 0, 20)
+                    oled.present()
             
-            if utime.ticks_diff(now, last_frame_time) > 200:  # update every 200ms
-                # Draw spinner
-                frame = spinner_frames[spinner_index % len(spinner_frames)]
-                oled.fill_rect(60, 40, 8, 8, 0)  # clear previous frame area
-                oled.text(frame, 60, 40)
-                oled.show()
-                spinner_index += 1
-                last_frame_time = now
-
-            if elapsed > DISP_ON_TIME_TICKS:
-                state = DisplayState.SHOW_IP
-                state_start_time = now
-
-        elif state == DisplayState.ANIMATION2:
-            if elapsed < 100:
-                oled.poweron()
-                oled.fill(0)
-                oled.show()
-
-            # Move the box every 100ms
-            if utime.ticks_diff(now, last_box_move) > 50:
-                # Clear previous box
-                oled.fill_rect(box_x, box_y, box_w, box_h, 0)
-
-                # Update position
-                box_x += box_dx
-                box_y += box_dy
-
-                # Bounce off edges
-                if box_x <= 0 or box_x + box_w >= WIDTH:
-                    box_dx = -box_dx
-                if box_y <= 0 or box_y + box_h >= HEIGHT:
-                    box_dy = -box_dy
-
-                # Draw new box
-                oled.fill_rect(box_x, box_y, box_w, box_h, 1)
-                oled.show()
-
-                last_box_move = now
-
-            if elapsed > ANIMATION_TIME_TICKS:
-                state = DisplayState.SHOW_SENSOR
-                state_start_time = now
-
-
-        # Feed watchdog every loop
-        wdt.feed()
-        utime.sleep_ms(50)
+                if utime.ticks_diff(now, last_frame_time) > 200:  # update every 200ms
+                    # Draw spinner
+                    frame = spinner_frames[spinner_index % len(spinner_frames)]
+                    oled.fill_rect(60, 40, 8, 8, 0)  # clear previous frame area
+                    oled.text(frame, 60, 40)
+                    oled.present()
+                    spinner_index += 1
+                    last_frame_time = now
+
+                if elapsed > DISP_ON_TIME_TICKS:
+                    state = DisplayState.SHOW_IP
+                    state_start_time = now
+
+            elif state == DisplayState.ANIMATION2:
+                if elapsed < 100:
+                    oled.poweron()
+                    oled.fill(0)
+                    oled.present()
+
+                # Move the box every 100ms
+                if utime.ticks_diff(now, last_box_move) > 50:
+                    # Clear previous box
+                    oled.fill_rect(box_x, box_y, box_w, box_h, 0)
+
+                    # Update position
+                    box_x += box_dx
+                    box_y += box_dy
+
+                    # Bounce off edges
+                    if box_x <= 0 or box_x + box_w >= WIDTH:
+                        box_dx = -box_dx
+                    if box_y <= 0 or box_y + box_h >= HEIGHT:
+                        box_dy = -box_dy
+
+                    # Draw new box
+                    oled.fill_rect(box_x, box_y, box_w, box_h, 1)
+                    oled.present()
+
+                    last_box_move = now
+
+                if elapsed > ANIMATION_TIME_TICKS:
+                    state = DisplayState.SHOW_SENSOR
+                    state_start_time = now
+
+
+            # Feed watchdog every loop
+            wdt.feed()
+            utime.sleep_ms(50)
+    except Exception:
+        # keep what the flash log buffered; the watchdog resets the board
+        tierlog.flush()
+        raise
 
 if __name__ == "__main__":
     main()
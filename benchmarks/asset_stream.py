@@ -0,0 +1,74 @@
+# Compare the 616x64 logo held as a resident bytearray literal with the
+# same image streamed from a PackBits .vlz file: import/open time, heap
+# allocated while loading (before a collect), heap kept afterwards and
+# columns decoded per second. The scroll demos feed one column per frame,
+# so cols/s is also the frame rate the decoding alone allows.
+# Copy to the Pico with bw_scroll/image_arrays.py, bw_scroll/bw_logo.vlz
+# and bw_scroll/lib/vlz.py.
+import gc
+import sys
+import time
+
+import framebuf
+from vlz import VLZStream
+
+WIDTH = 616
+HEIGHT = 64
+PAGES = HEIGHT // 8
+
+
+def heap_used():
+    return gc.mem_alloc()
+
+
+def literal():
+    gc.collect()
+    base = heap_used()
+    start = time.ticks_us()
+    from image_arrays import bw_buffer
+    load_us = time.ticks_diff(time.ticks_us(), start)
+    alloc = heap_used() - base  # includes the compiler's garbage
+    gc.collect()
+    resident = heap_used() - base
+    fb = framebuf.FrameBuffer(bw_buffer, WIDTH, HEIGHT, framebuf.MONO_HLSB)
+    column = bytearray(PAGES)
+    start = time.ticks_us()
+    for x in range(WIDTH):
+        for page in range(PAGES):
+            byte = 0
+            for bit in range(8):
+                if fb.pixel(x, page * 8 + bit):
+                    byte |= 1 << bit
+            column[page] = byte
+    run_us = time.ticks_diff(time.ticks_us(), start)
+    del sys.modules["image_arrays"]
+    return load_us, alloc, resident, run_us
+
+
+def stream():
+    gc.collect()
+    base = heap_used()
+    start = time.ticks_us()
+    logo = VLZStream("bw_logo.vlz")
+    column = bytearray(logo.pages)
+    load_us = time.ticks_diff(time.ticks_us(), start)
+    alloc = heap_used() - base
+    gc.collect()
+    resident = heap_used() - base
+    start = time.ticks_us()
+    for x in range(logo.width):
+        logo.read_into(column)
+    run_us = time.ticks_diff(time.ticks_us(), start)
+    logo.close()
+    return load_us, alloc, resident, run_us
+
+
+def report(name, result):
+    load_us, alloc, resident, run_us = result
+    cols = WIDTH * 1000000 // run_us
+    print("{:<10}{:>10}{:>10}{:>10}{:>10}".format(name, load_us // 1000, alloc, resident, cols))
+
+
+print("{:<10}{:>10}{:>10}{:>10}{:>10}".format("asset", "load ms", "alloc B", "kept B", "cols/s"))
+report("literal", literal())
+report("vlz", stream())
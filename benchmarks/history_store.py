@@ -0,0 +1,79 @@
+# Compare the array-backed History from air_qual_mqtt/lib/timeseries.py
+# with a list of (ticks, aqi, tvoc, eco2, temp) tuples: heap per stored
+# sample and the cost of adding a sample and reading the eCO2 min, max and
+# mean, which the list has to rescan for. Copy to the Pico with
+# air_qual_mqtt/lib/timeseries.py. Also runs under CPython, where heap use
+# is measured with tracemalloc.
+import gc
+import time
+
+from timeseries import History
+
+SIZE = 360  # one hour at a 10 s refresh
+UPDATES = 1000
+
+try:
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+except AttributeError:
+    ticks_us = lambda: time.perf_counter_ns() // 1000
+    ticks_diff = lambda a, b: a - b
+
+try:
+    heap_used = gc.mem_alloc
+    tracemalloc = None
+except AttributeError:
+    import tracemalloc
+    heap_used = lambda: tracemalloc.get_traced_memory()[0]
+
+
+def sample(i):
+    return i * 10000, 1 + i % 3, 100 + (i * 7) % 300, 500 + (i * 13) % 700, 20 + (i % 50) / 10
+
+
+class TupleHistory:
+    # the obvious version: a list of tuples, statistics by scanning
+    def __init__(self, size):
+        self.size = size
+        self.samples = []
+
+    def push(self, ticks, aqi, tvoc, eco2, temp):
+        if len(self.samples) == self.size:
+            self.samples.pop(0)
+        self.samples.append((ticks, aqi, tvoc, eco2, temp))
+
+    def eco2_stats(self):
+        values = [s[3] for s in self.samples]
+        return min(values), max(values), sum(values) / len(values)
+
+
+def array_stats(history):
+    return history.eco2.min, history.eco2.max, history.eco2.mean
+
+
+def run(name, history, stats):
+    if tracemalloc:
+        tracemalloc.start()
+    gc.collect()
+    base = heap_used()
+    h = history(SIZE)
+    for i in range(SIZE):
+        h.push(*sample(i))
+    gc.collect()
+    resident = heap_used() - base
+    if tracemalloc:
+        tracemalloc.stop()  # it would slow down the timed loop
+    start = ticks_us()
+    for i in range(SIZE, SIZE + UPDATES):
+        h.push(*sample(i))
+        stats(h)
+    run_us = ticks_diff(ticks_us(), start)
+    print("{:<8}{:>10}{:>12.1f}{:>14.1f}".format(name, resident, resident / SIZE, run_us / UPDATES))
+    return stats(h)
+
+
+print("{} samples held, {} updates".format(SIZE, UPDATES))
+print("{:<8}{:>10}{:>12}{:>14}".format("store", "heap B", "B/sample", "us/update"))
+a = run("tuples", TupleHistory, TupleHistory.eco2_stats)
+b = run("arrays", History, array_stats)
+assert a == b, (a, b)
@@ -0,0 +1,68 @@
+# Time a range query on the tierlog raw tier through the block index
+# against scanning the whole file, for ranges at the end of the log (the
+# "last hour" case) and near its start. Writes a log of RECORDS raw
+# samples under bench_log/ first. Copy to the Pico with
+# air_qual_mqtt/lib/tierlog.py; also runs under CPython.
+import os
+import struct
+import time
+
+from tierlog import RAW_SIZE, TierLog
+
+RECORDS = 8192  # 128 KB of raw records
+STEP = 10  # seconds between samples
+T0 = 1700000000
+DIRECTORY = "bench_log"
+
+try:
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+except AttributeError:
+    ticks_us = lambda: time.perf_counter_ns() // 1000
+    ticks_diff = lambda a, b: a - b
+
+
+def clear():
+    try:
+        for name in os.listdir(DIRECTORY):
+            os.remove(DIRECTORY + "/" + name)
+    except OSError:
+        pass
+
+
+def full_scan(path, t0, t1):
+    # the unindexed version: read every record of the file
+    n = 0
+    buf = bytearray(512)
+    with open(path, "rb") as f:
+        while True:
+            got = f.readinto(buf)
+            if not got:
+                break
+            for offset in range(0, got, RAW_SIZE):
+                t = struct.unpack_from("<I", buf, offset)[0]
+                if t0 <= t < t1:
+                    n += 1
+    return n
+
+
+clear()
+log = TierLog(DIRECTORY, tiers=((0, RECORDS * RAW_SIZE),))
+start = ticks_us()
+for i in range(RECORDS):
+    log.append(T0 + i * STEP, 1, 100 + i % 50, 500 + i % 300, 21.5)
+print("wrote {} records in {} ms".format(RECORDS, ticks_diff(ticks_us(), start) // 1000))
+tier = log.tiers[0]
+end = T0 + RECORDS * STEP
+
+print("{:<12}{:>9}{:>12}{:>12}".format("range", "records", "index us", "scan us"))
+for name, t0, t1 in (("last hour", end - 3600, end), ("last 6 h", end - 21600, end), ("first hour", T0, T0 + 3600)):
+    start = ticks_us()
+    n = sum(1 for _ in log.scan(t0, t1))
+    index_us = ticks_diff(ticks_us(), start)
+    start = ticks_us()
+    m = full_scan(tier.path, t0, t1)
+    scan_us = ticks_diff(ticks_us(), start)
+    assert n == m, (name, n, m)
+    print("{:<12}{:>9}{:>12}{:>12}".format(name, n, index_us, scan_us))
+clear()
@@ -0,0 +1,87 @@
+# Size and speed of air_qual_mqtt/lib/deltacode.py on sensor series:
+# bytes per value against 16-bit binary and the str() text MQTT publishes,
+# with and without run-length coding, and encode/decode rates. Uses
+# synthetic series plus the raw tier of the flash log in log/ when there
+# is one. Copy to the Pico with air_qual_mqtt/lib/deltacode.py (and
+# tierlog.py for the recorded series); also runs under CPython.
+import struct
+import time
+
+from deltacode import decode, encode
+
+N = 1000
+
+try:
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+except AttributeError:
+    ticks_us = lambda: time.perf_counter_ns() // 1000
+    ticks_diff = lambda a, b: a - b
+
+_seed = 12345
+
+
+def rand(n):
+    # small LCG, the same sequence on every port
+    global _seed
+    _seed = (_seed * 1103515245 + 12345) & 0x7FFFFFFF
+    return _seed % n
+
+
+def walk(start, step, low, high, hold):
+    # random walk that stays put with probability hold / 100
+    values = []
+    v = start
+    for _ in range(N):
+        if rand(100) >= hold:
+            v = min(high, max(low, v + rand(2 * step + 1) - step))
+        values.append(v)
+    return values
+
+
+def synthetic():
+    return [
+        ("aqi", walk(2, 1, 1, 5, 97)),
+        ("tvoc", walk(150, 8, 0, 65000, 40)),
+        ("eco2", walk(600, 10, 400, 65000, 40)),
+        ("temp x10", walk(215, 1, -400, 850, 90)),
+    ]
+
+
+def recorded(paths=("log/tier0.old", "log/tier0.bin")):
+    # aqi/tvoc/eco2/temp columns of the raw flash log, if there is one
+    columns = ([], [], [], [])
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+        for offset in range(0, len(data) - len(data) % 16, 16):
+            record = struct.unpack_from("<IHHHh", data, offset)
+            for i in range(4):
+                columns[i].append(record[i + 1])
+    names = ("log aqi", "log tvoc", "log eco2", "log temp")
+    return [(names[i], columns[i]) for i in range(4)] if columns[0] else []
+
+
+def rate(n, us):
+    return n * 1000000 // us if us else 0
+
+
+print("{:<10}{:>6}{:>7}{:>7}{:>8}{:>8}{:>10}{:>10}".format(
+    "series", "n", "text", "delta", "rle", "ratio", "enc/s", "dec/s"))
+for name, values in synthetic() + recorded():
+    n = len(values)
+    text = len(",".join(str(v) for v in values))
+    plain = len(encode(values, rle=False))
+    start = ticks_us()
+    packed = encode(values)
+    enc_us = ticks_diff(ticks_us(), start)
+    start = ticks_us()
+    back, _ = decode(packed)
+    dec_us = ticks_diff(ticks_us(), start)
+    assert back == values, name
+    # bytes per value; ratio against 2 bytes per value
+    print("{:<10}{:>6}{:>7.2f}{:>7.2f}{:>8.2f}{:>8.1f}{:>10}{:>10}".format(
+        name, n, text / n, plain / n, len(packed) / n, 2 * n / len(packed), rate(n, enc_us), rate(n, dec_us)))
@@ -0,0 +1,88 @@
+# Count SSD1306 I2C transactions per operation, one command per
+# transaction (the old write_cmd path) against batched write_cmds().
+# Copy to the Pico next to lib/ssd1306.py. With HARDWARE = False the bus
+# is only counted, so no display needs to be attached.
+from ssd1306 import SSD1306_I2C
+
+HARDWARE = False
+WIDTH = 128
+HEIGHT = 64
+
+
+class CountingI2C:
+    def __init__(self, i2c=None):
+        self.i2c = i2c
+        self.transactions = 0
+        self.bytes = 0
+
+    def reset(self):
+        self.transactions = 0
+        self.bytes = 0
+
+    def writeto(self, addr, buf, stop=True):
+        self.transactions += 1
+        self.bytes += len(buf)
+        if self.i2c:
+            self.i2c.writeto(addr, buf, stop)
+
+    def writevto(self, addr, bufs, stop=True):
+        self.transactions += 1
+        for buf in bufs:
+            self.bytes += len(buf)
+        if self.i2c:
+            self.i2c.writevto(addr, bufs, stop)
+
+
+class PerCommandSSD1306(SSD1306_I2C):
+    # the previous command path: one transaction per command byte
+    def write_cmds(self, cmds):
+        for cmd in cmds:
+            self.write_cmd(cmd)
+
+
+def full_frame(oled):
+    oled.fill(0)
+    oled.text("full frame", 0, 0)
+    oled.show()
+
+
+def one_line(oled):
+    oled.fill_rect(0, 24, WIDTH, 8, 0)
+    oled.text("one line", 0, 24)
+    oled.show()
+
+
+def dim(oled):
+    oled.contrast(64)
+
+
+def power_cycle(oled):
+    oled.poweroff()
+    oled.poweron()
+
+
+def measure(cls, bus):
+    bus.reset()
+    oled = cls(WIDTH, HEIGHT, bus)
+    results = [("init_display", bus.transactions, bus.bytes)]
+    for name, op in (("full frame", full_frame), ("one line", one_line), ("contrast", dim), ("power cycle", power_cycle)):
+        bus.reset()
+        op(oled)
+        results.append((name, bus.transactions, bus.bytes))
+    return results
+
+
+def main():
+    real = None
+    if HARDWARE:
+        from machine import Pin, I2C
+        real = I2C(0, scl=Pin(5), sda=Pin(4), freq=400000)
+    bus = CountingI2C(real)
+    before = measure(PerCommandSSD1306, bus)
+    after = measure(SSD1306_I2C, bus)
+    print("{:<14}{:>18}{:>18}".format("operation", "per-command tx/B", "batched tx/B"))
+    for (name, tx0, b0), (_, tx1, b1) in zip(before, after):
+        print("{:<14}{:>18}{:>18}".format(name, "{}/{}".format(tx0, b0), "{}/{}".format(tx1, b1)))
+
+
+main()
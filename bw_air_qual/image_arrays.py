@@ -1 +0,0 @@
-bw_buffer = bytearray(b'\x7F\xFF\xC0\x00\x3F\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFE\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xFF\xFF\x00\x1F\xFF\xF0\x01\xFF\xFF\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xC0\x00\x7F\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xF0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xFF\xFF\x00\x1F\xFF\xF0\x01\xFF\xFF\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xF0\x00\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFE\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xFF\xFF\x00\x1F\xFF\xF0\x01\xFF\xFF\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xF0\x01\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xFF\xFF\x80\x3F\xFF\xF0\x01\xFF\xFF\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xF8\x03\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xFF\xFF\x80\x3F\xFF\xF8\x03\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFE\x07\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xFF\xFF\x80\x3F\xFF\xF8\x03\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xFE\x0F\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xFF\xFF\x80\x3F\xFF\xF8\x03\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xFF\x9F\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xF0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xFF\xFF\x80\x7F\xFF\xFC\x03\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xBF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xF8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xFF\xFF\x80\x7F\xFF\xFC\x07\xFF\xFE\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFC\x3F\xFF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xF8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xFF\xFF\xC0\x7F\xFF\xFC\x07\xFF\xFE\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFE\x1F\xFF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xF8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xFF\xFF\xC0\x7F\xFF\xFC\x07\xFF\xFE\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\x0F\xFF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xF8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xC0\x7F\xFF\xFC\x07\xFF\xFC\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\x87\xFF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xF8\x3F\xFF\xF8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xE0\xFF\xFF\xFC\x0F\xFF\xFC\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xC3\xFF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xF8\x0F\xFF\xF8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xE0\xFF\xFF\xFE\x0F\xFF\xFC\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xE7\xFF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xF8\x07\xFF\xF8\x00\x00\x00\x00\x00\x00\x00\x00\x1F\x00\x00\x00\x00\x00\x7F\xFF\xE0\xFF\xFF\xFE\x0F\xFF\xFC\x01\xF8\x00\x00\x00\x00\x00\x03\xE0\x00\x00\x0F\xF0\x00\x00\x0F\xFF\x00\x00\x00\x00\x03\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0F\xFF\xFF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xF8\x07\xFF\xF8\x00\x03\xFF\xF8\x00\x0F\xFF\xF1\xFF\x00\x0F\xC0\xFF\xFF\xFF\xFF\xE1\xFF\xFF\xFE\x0F\xFF\xF8\x1F\xFF\x0F\xFF\xF9\xFF\xFF\x1F\xE7\xFF\xF8\x7F\xFE\x00\x00\xFF\xFF\xF0\x01\xFF\xFF\x1F\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xFF\xFF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xF8\x07\xFF\xF8\x00\x1F\xFF\xFE\x00\x0F\xFF\xF3\xFF\x00\x7F\xF0\xFF\xFF\xBF\xFF\xE1\xFF\xFF\xFF\x0F\xFF\xF8\x3F\xFF\xCF\xFF\xF9\xFF\xFF\x3F\xE7\xFF\xF9\xFF\xFF\x00\x03\xFF\xFF\xF8\x01\xFF\xFF\x3F\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xFF\xFF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xF8\x0F\xFF\xF8\x00\x7F\xFF\xFF\xC0\x0F\xFF\xF7\xFF\x01\xFF\xFE\xFF\xFF\xBF\xFF\xE1\xFF\xFF\xFF\x1F\xFF\xF8\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x7F\xE7\xFF\xFB\xFF\xFF\x80\x0F\xFF\xFF\xFE\x01\xFF\xFF\x7F\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xE0\xFF\xDF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xF8\x1F\xFF\xF0\x00\xFF\xFF\xFF\xE0\x0F\xFF\xFF\xFF\x07\xFF\xFF\xFF\xFF\x9F\xFF\xF1\xFF\xFF\xFF\x1F\xFF\xF1\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xFF\xE7\xFF\xFF\xFF\xFF\xC0\x1F\xFF\xFF\xFF\x01\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xF0\xFF\xDF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xE0\x01\xFF\xFF\xFF\xF0\x0F\xFF\xFF\xFF\x07\xFF\xFF\xFF\xFF\x9F\xFF\xF1\xFF\xFF\xFF\x1F\xFF\xF1\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xFF\xE7\xFF\xFF\xFF\xFF\xE0\x3F\xFF\xFF\xFF\x81\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xF9\xFF\xCF\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xE0\x03\xFF\xFF\xFF\xF8\x0F\xFF\xFF\xFF\x1F\xFF\xFF\xFF\xFF\x9F\xFF\xF3\xFF\xFF\xFF\x3F\xFF\xF3\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xFF\xE7\xFF\xFF\xFF\xFF\xE0\x7F\xFF\xFF\xFF\xC1\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xC7\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xC0\x07\xFF\xFF\xFF\xFC\x0F\xFF\xFF\xFF\x3F\xFF\xFF\xFF\xFF\x8F\xFF\xF3\xFF\xFF\xFF\xBF\xFF\xF7\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xFF\xE7\xFF\xFF\xFF\xFF\xE0\xFF\xFF\xFF\xFF\xE1\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xE3\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\x80\x0F\xFF\xFF\xFF\xFE\x0F\xFF\xFF\xFF\x3F\xFF\xFF\xFF\xFF\x8F\xFF\xFB\xFF\xFF\xFF\xBF\xFF\xF7\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xFF\xE7\xFF\xFF\xFF\xFF\xF0\xFF\xFF\xFF\xFF\xE1\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xFF\xFF\xF0\xFF\xE0\x00\x00\x00\x00\x1F\xFF\xFF\xFF\xFE\x00\x0F\xFF\xFF\xFF\xFE\x0F\xFF\xFF\xFF\x3F\xFF\xFF\xFF\xFF\x8F\xFF\xFB\xFF\xFF\xFF\xBF\xFF\xEF\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xFF\xE7\xFF\xFF\xFF\xFF\xF1\xFF\xFF\xFF\xFF\xF1\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xF0\x7F\xC0\x00\x00\x00\x00\x1F\xFF\xFF\xFF\xFC\x00\x1F\xFF\xFF\xFF\xFF\x0F\xFF\xFF\xFF\x7F\xFF\xFF\xFF\xFF\x8F\xFF\xFF\xFF\xFF\xFF\xBF\xFF\xEF\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xFF\xE7\xFF\xFF\xFF\xFF\xF1\xFF\xFF\x1F\xFF\xF1\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3F\xFF\xFC\x3F\xC0\x00\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\x80\x3F\xFF\xFF\xFF\xFF\x8F\xFF\xFF\xFF\x7F\xFF\xFF\xFF\xFF\x8F\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xFF\xE7\xFF\xFF\xFF\xFF\xF3\xFF\xFE\x0F\xFF\xF9\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFC\x1F\xC0\x00\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xE0\x3F\xFF\xFF\xFF\xFF\x8F\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\x87\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xDF\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xFF\xE7\xFF\xFC\x3F\xFF\xF3\xFF\xFC\x07\xFF\xF9\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xFF\xFF\xFF\x0F\xF0\x00\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xF8\x7F\xFF\xFF\xFF\xFF\x8F\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\x87\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xDF\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xFF\xE7\xFF\xFC\x1F\xFF\xF7\xFF\xFC\x07\xFF\xF9\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xFF\x87\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xF8\x7F\xFF\xE0\xFF\xFF\x8F\xFF\xFE\x00\xFF\xFF\x81\xFF\xFF\x87\xFF\xFF\xFF\xEF\xFF\xFF\xFF\xDF\xFF\xF8\x7F\xFF\xF9\xFF\xFF\xE0\x07\xFF\xF8\x1F\xFF\xF7\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xFF\x83\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xFC\x7F\xFF\xC0\x7F\xFF\x8F\xFF\xFC\x00\xFF\xFF\x00\xFF\xFF\x83\xFF\xFF\xFF\xEF\xFF\xFF\xFF\x9F\xFF\xF0\x1F\xFF\xF9\xFF\xFF\xC0\x07\xFF\xF8\x1F\xFF\xF7\xFF\xFF\xFF\xFF\xF9\xFF\xFF\xC0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xFF\xE1\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xFE\x7F\xFF\x80\x7F\xFF\xCF\xFF\xF8\x00\xFF\xFF\x00\xFF\xFF\x83\xFF\xFF\xFF\xCF\xFF\xFF\xFF\x9F\xFF\xF0\x1F\xFF\xF9\xFF\xFF\x80\x07\xFF\xF8\x1F\xFF\xF7\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xDF\xE0\xFF\xC0\x00\x00\x00\x1F\xFF\xF8\x1F\xFF\xFE\x7F\xFF\x80\x3F\xFF\xCF\xFF\xF8\x00\xFF\xFE\x00\xFF\xFF\x83\xFF\xFF\xFF\xC7\xFF\xFF\xFF\x9F\xFF\xE0\x0F\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF7\xFF\xFF\xFF\xFF\xFD\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xCF\xF8\x7F\xC0\x00\x00\x00\x1F\xFF\xF8\x0F\xFF\xFF\x7F\xFF\x00\x3F\xFF\xCF\xFF\xF0\x00\xFF\xFE\x00\xFF\xFF\x83\xFF\xFF\xFF\xC7\xFF\xFF\xFF\x9F\xFF\xE0\x0F\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF7\xFF\xFF\xFF\xFF\xFD\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xC7\xFC\x00\x00\x00\x00\x00\x1F\xFF\xF8\x07\xFF\xFF\x7F\xFF\x00\x3F\xFF\xCF\xFF\xF0\x00\xFF\xFE\x00\xFF\xFF\x81\xFF\xFF\xFF\xC7\xFF\xFF\xFF\x1F\xFF\xE0\x0F\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF7\xFF\xFF\xFF\xFF\xFD\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xE3\xFE\x00\x00\x00\x00\x00\x1F\xFF\xF8\x07\xFF\xFF\x7F\xFF\x80\x3F\xFF\xCF\xFF\xF0\x00\xFF\xFF\x00\xFF\xFF\x81\xFF\xFF\xFF\xC3\xFF\xFF\xFF\x1F\xFF\xE0\x1F\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF7\xFF\xFF\xFF\xFF\xFD\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xF0\xFF\x00\x00\x00\x00\x00\x1F\xFF\xF8\x07\xFF\xFF\x7F\xFF\x80\x7F\xFF\xCF\xFF\xF0\x00\xFF\xFF\x81\xFF\xFF\x81\xFF\xFF\xFF\x83\xFF\xFF\xFF\x1F\xFF\xF0\x1F\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF7\xFF\xF8\x00\x00\x01\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xF0\xFF\x00\x00\x00\x00\x00\x1F\xFF\xF8\x07\xFF\xFF\x7F\xFF\x80\x7F\xFF\x8F\xFF\xF0\x00\xFF\xFF\xC3\xFF\xFF\x80\xFF\xFF\xFF\x83\xFF\xFF\xFE\x1F\xFF\xF8\x3F\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF7\xFF\xF8\x00\x00\x01\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xFC\x7F\xFF\xC0\x00\x00\x00\x1F\xFF\xF8\x0F\xFF\xFF\x7F\xFF\xE1\xFF\xFF\x8F\xFF\xF0\x00\xFF\xFF\xFF\xFF\xFF\x80\xFF\xFF\xFF\x83\xFF\xFF\xFE\x1F\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF7\xFF\xFC\x00\x00\x01\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xFC\x3F\xFF\xC0\x00\x00\x00\x1F\xFF\xFE\x3F\xFF\xFF\x7F\xFF\xFF\xFF\xFF\x8F\xFF\xF0\x00\xFF\xFF\xFF\xFF\xFF\x80\xFF\xFF\xFF\x01\xFF\xFF\xFE\x1F\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF7\xFF\xFC\x07\xFF\xF9\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xFF\x1F\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xFF\x3F\xFF\xFF\xFF\xFF\x8F\xFF\xF0\x00\x7F\xFF\xFF\xFF\xFF\x80\xFF\xFF\xFF\x01\xFF\xFF\xFE\x0F\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF3\xFF\xFE\x0F\xFF\xF9\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xFF\x87\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xFE\x3F\xFF\xFF\xFF\xFF\x0F\xFF\xF0\x00\x7F\xFF\xFF\xFF\xFF\x80\xFF\xFF\xFF\x01\xFF\xFF\xFE\x0F\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF3\xFF\xFF\x9F\xFF\xF9\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xFF\x87\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xFE\x1F\xFF\xFF\xFF\xFF\x0F\xFF\xF0\x00\x3F\xFF\xFF\xFF\xFF\x80\x7F\xFF\xFE\x00\xFF\xFF\xFC\x0F\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF1\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xBF\xE0\x00\x00\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xFC\x1F\xFF\xFF\xFF\xFE\x0F\xFF\xF0\x00\x3F\xFF\xFF\xFF\xFF\x80\x7F\xFF\xFE\x00\xFF\xFF\xFC\x07\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF1\xFF\xFF\xFF\xFF\xF1\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\x1F\xE0\x00\x00\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xFC\x0F\xFF\xFF\xFF\xFE\x0F\xFF\xF0\x00\x1F\xFF\xFF\xFF\xFF\x80\x7F\xFF\xFE\x00\xFF\xFF\xFC\x07\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF0\xFF\xFF\xFF\xFF\xE1\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFE\x07\xF8\x00\x00\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xF8\x07\xFF\xFF\xFF\xFC\x0F\xFF\xF0\x00\x1F\xFF\xFF\xFF\xFF\x80\x3F\xFF\xFE\x00\xFF\xFF\xF8\x07\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF0\x7F\xFF\xFF\xFF\xE1\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFC\x03\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xF0\x03\xFF\xFF\xFF\xF8\x0F\xFF\xF0\x00\x07\xFF\xFF\xFF\xFF\x80\x3F\xFF\xFC\x00\xFF\xFF\xF8\x03\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF0\x3F\xFF\xFF\xFF\x81\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xF8\x01\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xE0\x03\xFF\xFF\xFF\xF0\x0F\xFF\xF0\x00\x03\xFF\xFF\xFF\xFF\x80\x3F\xFF\xFC\x00\x7F\xFF\xF8\x01\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF0\x3F\xFF\xFF\xFF\x01\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xF8\x00\xFF\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\xC0\x00\xFF\xFF\xFF\xE0\x0F\xFF\xF0\x00\x01\xFF\xFE\xFF\xFF\x80\x1F\xFF\xFC\x00\x7F\xFF\xF8\x00\xFF\xFF\xFF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF0\x0F\xFF\xFF\xFE\x01\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xF0\x00\x7F\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xFF\x00\x00\x7F\xFF\xFF\xC0\x0F\xFF\xF0\x00\x00\x7F\xF0\xFF\xFF\x80\x1F\xFF\xF8\x00\x7F\xFF\xF0\x00\x7F\xFF\xCF\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF0\x07\xFF\xFF\xF8\x01\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xE0\x00\x3F\xFF\xC0\x00\x00\x00\x1F\xFF\xFF\xFF\xF8\x00\x00\x1F\xFF\xFF\x00\x0F\xFF\xF0\x00\x00\x03\x00\xFF\xFF\x80\x1F\xFF\xF8\x00\x3F\xFF\xF0\x00\x3F\xFF\x0F\xFF\xF9\xFF\xFF\x00\x07\xFF\xF8\x1F\xFF\xF0\x01\xFF\xFF\xE0\x01\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xFF\xF8\x00\x00\x00\x00\x00\x00\x00\x00\xFF\xFF\x80\x00\x00\x00\x00\x00\x00\x00\x00\x07\xF8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0F\xFC\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3F\x80\x00\x00\x00\x00\x00\xFF\xFF\x00\xFF\xFF\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xFF\xFF\x83\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xEF\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFF\xFF\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3F\xFF\xFF\xFF\xFE\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3F\xFF\xFF\xFF\xFC\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1F\xFF\xFF\xFF\xF8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xFF\xFF\xFF\xF0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xFF\xFF\xFF\xE0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xFF\xFF\xFF\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7F\xFF\xFE\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0F\xFF\xF0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
\ No newline at end of file
@@ -1,16 +1,16 @@
 # Display Image & text on I2C driven ssd1306 OLED display 
 from machine import Pin, I2C, ADC
 from ssd1306 import SSD1306_I2C
-import framebuf
 import utime
 import sys
-from image_arrays import bw_buffer
+from vlz import VLZStream
 from PiicoDev_ENS160 import PiicoDev_ENS160 # import the device driver
 from PiicoDev_Unified import sleep_ms       # a cross-platform sleep function
 
 
 WIDTH  = 128                                            # oled display width
 HEIGHT = 64                                            # oled display height
+CONTENT_SCROLL = True                                  # False for an original SSD1306, which has no content scroll
 
 sensor_temp = ADC(4)
 conversion_factor = 3.3 / (65535)
@@ -29,23 +29,25 @@ print("I2C Configuration: "+str(i2c))                   # Display I2C config
 
 
 try:
-    oled = SSD1306_I2C(WIDTH, HEIGHT, i2c,addr=oled_addr,external_vcc=False)                  # Init oled display
+    oled = SSD1306_I2C(WIDTH, HEIGHT, i2c,addr=oled_addr,external_vcc=False,content_scroll=CONTENT_SCROLL)                  # Init oled display
 except OSError:
     print("EIO Error - Possible Address conflict")
     sys.exit()
 
-sensor = PiicoDev_ENS160(bus=0,scl=Pin(5), sda=Pin(4),freq=400000)   # Initialise the ENS160 module
+sensor = PiicoDev_ENS160(i2c=i2c)   # Initialise the ENS160 module on the same I2C bus
 
 
-# Raspberry Pi logo as 32x32 bytearray
-rpi_buffer = bytearray(b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00|?\x00\x01\x86@\x80\x01\x01\x80\x80\x01\x11\x88\x80\x01\x05\xa0\x80\x00\x83\xc1\x00\x00C\xe3\x00\x00~\xfc\x00\x00L'\x00\x00\x9c\x11\x00\x00\xbf\xfd\x00\x00\xe1\x87\x00\x01\xc1\x83\x80\x02A\x82@\x02A\x82@\x02\xc1\xc2@\x02\xf6>\xc0\x01\xfc=\x80\x01\x18\x18\x80\x01\x88\x10\x80\x00\x8c!\x00\x00\x87\xf1\x00\x00\x7f\xf6\x00\x008\x1c\x00\x00\x0c \x00\x00\x03\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00")
-# Load the raspberry pi logo into the framebuffer (the image is 32x32)
-fb = framebuf.FrameBuffer(rpi_buffer, 32, 32, framebuf.MONO_HLSB)
+# The BW logo (616x64) is streamed from flash one MONO_VLSB column at a
+# time, so only the column and a small read window are held in RAM
+logo = VLZStream('bw_logo.vlz')
+column = bytearray(logo.pages)
 
-# Load the BW logo into the framebuffer (the image is 64x64)
-image_w = 616
-image_h = 64
-bw_fb = framebuf.FrameBuffer(bw_buffer, image_w, image_h, framebuf.MONO_HLSB)
+def logo_column(x):
+    if x < logo.width:
+        logo.read_into(column)
+    else:
+        for page in range(len(column)):
+            column[page] = 0
 
 #setup some strings
 aqi_str =  '   AQI: '
@@ -63,11 +65,13 @@ oled.show()
 while True:
     meas_count = 0
     sum_readings = 0
-    for i in range(128,-520,-1):
-        oled.blit(bw_fb, i, 0)
-        oled.show()
-        sum_readings+=sensor_temp.read_u16() * conversion_factor
-        meas_count+=1
+    # Scroll the logo in from the right, pushing one new column per step
+    logo.rewind()
+    for i in range(logo.width + 32):
+        logo_column(i)
+        while not oled.feed_column(column):
+            sum_readings+=sensor_temp.read_u16() * conversion_factor
+            meas_count+=1
         
     oled.fill(0)
     oled.show()
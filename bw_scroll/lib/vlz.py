@@ -0,0 +1,75 @@
+# Streamed reader for .vlz image assets written by tools/img2vlsb.py
+#
+# A .vlz file is a 10 byte header followed by the MONO_VLSB image bytes
+# compressed with PackBits:
+#   b"VLZ1", width (u16 LE), height (u16 LE), order (u8), reserved (u8)
+# order 0 stores the bytes page by page (page * width + x), order 1
+# column by column (x * pages + page), which suits horizontal scrolling.
+# Only a small input window is held in RAM, the image stays on flash.
+
+MAGIC = b"VLZ1"
+HEADER = 10
+ORDER_PAGES = 0
+ORDER_COLUMNS = 1
+
+
+class VLZStream:
+    def __init__(self, path, window=64):
+        self._f = open(path, "rb")
+        hdr = self._f.read(HEADER)
+        if hdr[:4] != MAGIC:
+            self._f.close()
+            raise ValueError("not a VLZ1 file")
+        self.width = hdr[4] | hdr[5] << 8
+        self.height = hdr[6] | hdr[7] << 8
+        self.pages = (self.height + 7) // 8
+        self.order = hdr[8]
+        self._in = bytearray(window)
+        self.rewind()
+
+    def rewind(self):
+        self._f.seek(HEADER)
+        self._len = 0
+        self._pos = 0
+        self._literal = 0  # literal bytes left in the current run
+        self._repeat = 0  # copies of _value left in the current run
+        self._value = 0
+
+    def _byte(self):
+        if self._pos >= self._len:
+            self._len = self._f.readinto(self._in)
+            self._pos = 0
+            if not self._len:
+                raise EOFError
+        b = self._in[self._pos]
+        self._pos += 1
+        return b
+
+    def read_into(self, buf, n=None):
+        # decode the next n (default len(buf)) image bytes into buf
+        if n is None:
+            n = len(buf)
+        i = 0
+        while i < n:
+            if self._literal:
+                buf[i] = self._byte()
+                self._literal -= 1
+                i += 1
+            elif self._repeat:
+                run = min(self._repeat, n - i)
+                value = self._value
+                for j in range(i, i + run):
+                    buf[j] = value
+                self._repeat -= run
+                i += run
+            else:
+                header = self._byte()
+                if header < 128:
+                    self._literal = header + 1
+                elif header > 128:
+                    self._repeat = 257 - header
+                    self._value = self._byte()
+        return n
+
+    def close(self):
+        self._f.close()
@@ -12,27 +12,74 @@ setupi2c_str = ', run "sudo curl -L https://piico.dev/i2csetup | bash". Suppress
 
 if _SYSNAME == 'microbit':
     from microbit import i2c
-    from utime import sleep_ms
+    from utime import sleep_ms, ticks_us, ticks_diff
     
 elif _SYSNAME == 'Linux':
     from smbus2 import SMBus, i2c_msg
-    from time import sleep
+    from time import sleep, perf_counter
     from math import ceil
+    from ctypes import c_char
     
     def sleep_ms(t):
         sleep(t/1000)
 
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(a, b):
+        return a - b
+
 else:
     from machine import I2C, Pin
-    from utime import sleep_ms
+    from utime import sleep_ms, ticks_us, ticks_diff
+
+class I2CBatch:
+    # Register reads and writes queued inside "with i2c.batch() as b:" and
+    # run together when the block ends, as one transaction where the
+    # platform allows it. read() returns the buffer it will fill.
+    def __init__(self, i2c):
+        self.i2c = i2c
+        self.ops = []  # (is_read, addr, memaddr, buf, addrsize)
+
+    def read(self, addr, memaddr, buf, *, addrsize=8):
+        if isinstance(buf, int):
+            buf = bytearray(buf)
+        self.ops.append((True, addr, memaddr, buf, addrsize))
+        return buf
+
+    def write(self, addr, memaddr, buf, *, addrsize=8):
+        self.ops.append((False, addr, memaddr, buf, addrsize))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None and self.ops:
+            self.i2c.run_batch(self.ops)
+        self.ops = []
+        return False
 
 class I2CBase:
+    def batch(self):
+        return I2CBatch(self)
+
+    def run_batch(self, ops):
+        # one combined write + repeated start read per register read
+        for is_read, addr, memaddr, buf, addrsize in ops:
+            if is_read:
+                self.readfrom_mem_into(addr, memaddr, buf, addrsize=addrsize)
+            else:
+                self.writeto_mem(addr, memaddr, buf, addrsize=addrsize)
+
     def writeto_mem(self, addr, memaddr, buf, *, addrsize=8):
         raise NotImplementedError('writeto_mem')
 
     def readfrom_mem(self, addr, memaddr, nbytes, *, addrsize=8):
         raise NotImplementedError('readfrom_mem')
 
+    def readfrom_mem_into(self, addr, memaddr, buf, *, addrsize=8):
+        raise NotImplementedError('readfrom_mem_into')
+
     def write8(self, addr, buf, stop=True):
         raise NotImplementedError('write')
 
@@ -43,8 +90,10 @@ class I2CBase:
         raise NotImplementedError('__init__')
 
 class I2CUnifiedMachine(I2CBase):
-    def __init__(self, bus=None, freq=None, sda=None, scl=None):
-        if bus is not None and freq is not None and sda is not None and scl is not None:
+    def __init__(self, bus=None, freq=None, sda=None, scl=None, i2c=None):
+        if i2c is not None:
+            self.i2c = i2c  # an existing machine.I2C, used as configured
+        elif bus is not None and freq is not None and sda is not None and scl is not None:
             print('Using supplied freq, sda and scl to create machine I2C')
             self.i2c = I2C(bus, freq=freq, sda=sda, scl=scl)
         else:
@@ -52,6 +101,13 @@ class I2CUnifiedMachine(I2CBase):
 
         self.writeto_mem = self.i2c.writeto_mem
         self.readfrom_mem = self.i2c.readfrom_mem
+        self.readfrom_mem_into = self.i2c.readfrom_mem_into
+        # raw transfers too, so display drivers can share the handle
+        self.writeto = self.i2c.writeto
+        self.writevto = self.i2c.writevto
+        self.readfrom_into = self.i2c.readfrom_into
+        self.readfrom = self.i2c.readfrom
+        self.scan = self.i2c.scan
 
     def write8(self, addr, reg, data):
         if reg is None:
@@ -77,6 +133,9 @@ class I2CUnifiedMicroBit(I2CBase):
         ad = memaddr.to_bytes(addrsize // 8, 'big')  # pad address for eg. 16 bit
         i2c.write(addr, ad, repeat=True)
         return i2c.read(addr, nbytes)    
+
+    def readfrom_mem_into(self, addr, memaddr, buf, *, addrsize=8):
+        buf[:] = self.readfrom_mem(addr, memaddr, len(buf), addrsize=addrsize)
     
     def write8(self, addr, reg, data):
         if reg is None:
@@ -89,7 +148,7 @@ class I2CUnifiedMicroBit(I2CBase):
         return i2c.read(addr, 2)
             
 class I2CUnifiedLinux(I2CBase):
-    def __init__(self, bus=None, suppress_warnings=True):
+    def __init__(self, bus=None, suppress_warnings=True, i2c=None):
         if suppress_warnings == False:
             with open('/boot/config.txt') as config_file:
                 if 'dtparam=i2c_arm=on' in config_file.read():
@@ -103,46 +162,176 @@ class I2CUnifiedLinux(I2CBase):
                 else:
                     print('Slow baudrate detected. If glitching occurs' + setupi2c_str)
                 config_file.close()
-        if bus is None:
-            bus = 1
-        self.i2c = SMBus(bus)
+        if i2c is not None:
+            self.i2c = i2c  # an existing SMBus
+        else:
+            self.i2c = SMBus(1 if bus is None else bus)
+        self._rd = i2c_msg.read(0, 0).flags
+        self._wbuf = None
+        self._scratch(32)
+        self._rbuf = None  # last read buffer and the message that points at it
+        self._rmsg = None
+        self._bregs = []  # scratch buffer per batch position
+        self._bmsgs = []  # (buffer, i2c_msg) per batch position
 
-    def readfrom_mem(self, addr, memaddr, nbytes, *, addrsize=8):
-        data = [None] * nbytes # initialise empty list
-        self.smbus_i2c_read(addr, memaddr, data, nbytes, addrsize=addrsize)
-        return data
-    
-    def writeto_mem(self, addr, memaddr, buf, *, addrsize=8):
-        self.smbus_i2c_write(addr, memaddr, buf, len(buf), addrsize=addrsize)
-    
-    def smbus_i2c_write(self, address, reg, data_p, length, addrsize=8):
-        ret_val = 0
-        data = []
-        for index in range(length):
-            data.append(data_p[index])
-        if addrsize == 8:
-            msg_w = i2c_msg.write(address, [reg] + data)
-        elif addrsize == 16:
-            msg_w = i2c_msg.write(address, [reg >> 8, reg & 0xff] + data)
+    # Messages point straight into the caller's buffers where they are
+    # writable; writes that need the register address in front of the data
+    # go through one reusable scratch buffer and its message. The message
+    # for the last read buffer is kept, drivers read into the same buffer
+    # every time (which keeps that bytearray from being resized). Same API
+    # as machine.I2C.
+
+    def _scratch(self, n):
+        if self._wbuf is None or len(self._wbuf) < n:
+            self._wbuf = bytearray(max(n, 32))
+            self._wmsg = i2c_msg(addr=0, flags=0, len=0, buf=(c_char * len(self._wbuf)).from_buffer(self._wbuf))
+        return self._wbuf
+
+    def _write_msg(self, addr, buf, n):
+        # i2c_msg writing the first n bytes of buf without copying them
+        if buf is self._wbuf:
+            msg = self._wmsg
         else:
-            raise Exception('address must be 8 or 16 bits long only')
-        self.i2c.i2c_rdwr(msg_w)
-        return ret_val
-        
-    def smbus_i2c_read(self, address, reg, data_p, length, addrsize=8):
-        ret_val = 0
+            msg = i2c_msg(addr=0, flags=0, len=0, buf=(c_char * n).from_buffer(buf))
+        msg.addr = addr
+        msg.len = n
+        return msg
+
+    def _read_msg(self, addr, buf):
+        # i2c_msg reading into buf without copying
+        n = len(buf)
+        if buf is not self._rbuf:
+            self._rmsg = i2c_msg(addr=addr, flags=self._rd, len=n, buf=(c_char * n).from_buffer(buf))
+            self._rbuf = buf
+        msg = self._rmsg
+        msg.addr = addr
+        msg.len = n
+        return msg
+
+    def _reg(self, memaddr, addrsize, extra=0):
+        # register address bytes at the start of the scratch buffer, with
+        # room for extra bytes after them; returns the address length
         if addrsize == 8:
-            msg_w = i2c_msg.write(address, [reg]) # warning this is set up for 16-bit addresses
+            buf = self._scratch(1 + extra)
+            buf[0] = memaddr
+            return 1
         elif addrsize == 16:
-            msg_w = i2c_msg.write(address, [reg >> 8, reg & 0xff]) # warning this is set up for 16-bit addresses
+            buf = self._scratch(2 + extra)
+            buf[0] = memaddr >> 8
+            buf[1] = memaddr & 0xff
+            return 2
+        raise Exception('address must be 8 or 16 bits long only')
+
+    def readfrom_mem_into(self, addr, memaddr, buf, *, addrsize=8):
+        n = self._reg(memaddr, addrsize)
+        self.i2c.i2c_rdwr(self._write_msg(addr, self._wbuf, n), self._read_msg(addr, buf))
+
+    def readfrom_mem(self, addr, memaddr, nbytes, *, addrsize=8):
+        buf = bytearray(nbytes)
+        self.readfrom_mem_into(addr, memaddr, buf, addrsize=addrsize)
+        return bytes(buf)
+
+    def writeto_mem(self, addr, memaddr, buf, *, addrsize=8):
+        n = self._reg(memaddr, addrsize, len(buf))
+        end = n + len(buf)
+        self._wbuf[n:end] = buf
+        self.i2c.i2c_rdwr(self._write_msg(addr, self._wbuf, end))
+
+    def readfrom_into(self, addr, buf, stop=True):
+        self.i2c.i2c_rdwr(self._read_msg(addr, buf))
+
+    def readfrom(self, addr, nbytes, stop=True):
+        buf = bytearray(nbytes)
+        self.readfrom_into(addr, buf)
+        return bytes(buf)
+
+    def writeto(self, addr, buf, stop=True):
+        n = len(buf)
+        if isinstance(buf, bytearray) or (isinstance(buf, memoryview) and not buf.readonly):
+            self.i2c.i2c_rdwr(self._write_msg(addr, buf, n))
         else:
-            raise Exception('address must be 8 or 16 bits long only')
-        msg_r = i2c_msg.read(address, length)
-        self.i2c.i2c_rdwr(msg_w, msg_r)
-        if ret_val == 0:
-            for index in range(length):
-                data_p[index] = ord(msg_r.buf[index])
-        return ret_val
+            self._scratch(n)[:n] = buf
+            self.i2c.i2c_rdwr(self._write_msg(addr, self._wbuf, n))
+        return n
+
+    def writevto(self, addr, vector, stop=True):
+        # the buffers are sent as one message, as on machine.I2C
+        n = 0
+        for buf in vector:
+            n += len(buf)
+        out = self._scratch(n)
+        pos = 0
+        for buf in vector:
+            out[pos:pos + len(buf)] = buf
+            pos += len(buf)
+        self.i2c.i2c_rdwr(self._write_msg(addr, out, n))
+        return n
+
+    def _batch_msg(self, i, addr, flags, buf, n):
+        # i2c_msg for position i of a batch, kept while the same buffer is
+        # used in that position
+        msgs = self._bmsgs
+        while len(msgs) <= i:
+            msgs.append(None)
+        entry = msgs[i]
+        if entry is None or entry[0] is not buf:
+            entry = msgs[i] = (buf, i2c_msg(addr=0, flags=0, len=0, buf=(c_char * len(buf)).from_buffer(buf)))
+        msg = entry[1]
+        msg.addr = addr
+        msg.flags = flags
+        msg.len = n
+        return msg
+
+    def run_batch(self, ops):
+        # every operation as messages of one i2c_rdwr() call, repeated
+        # starts between them and one stop at the end. The kernel takes at
+        # most 42 messages per call, longer batches are split between
+        # operations so that a register read never loses its repeated
+        # start. Register addresses (and write data) go through a scratch
+        # buffer per position, reads straight into the caller's buffers.
+        msgs = []
+        first = 0  # first message of the call being built
+        regs = self._bregs
+        for is_read, addr, memaddr, buf, addrsize in ops:
+            if addrsize == 8:
+                k = 1
+            elif addrsize == 16:
+                k = 2
+            else:
+                raise Exception('address must be 8 or 16 bits long only')
+            i = len(msgs)
+            if i - first + (2 if is_read else 1) > 42:
+                self.i2c.i2c_rdwr(*msgs[first:i])
+                first = i
+            n = k if is_read else k + len(buf)
+            while len(regs) <= i:
+                regs.append(bytearray(32))
+            if len(regs[i]) < n:
+                regs[i] = bytearray(n)
+            reg = regs[i]
+            if k == 1:
+                reg[0] = memaddr
+            else:
+                reg[0] = memaddr >> 8
+                reg[1] = memaddr & 0xff
+            if is_read:
+                msgs.append(self._batch_msg(i, addr, 0, reg, n))
+                msgs.append(self._batch_msg(i + 1, addr, self._rd, buf, len(buf)))
+            else:
+                reg[k:n] = buf
+                msgs.append(self._batch_msg(i, addr, 0, reg, n))
+        if first < len(msgs):
+            self.i2c.i2c_rdwr(*msgs[first:])
+
+    def smbus_i2c_write(self, address, reg, data_p, length, addrsize=8):
+        self.writeto_mem(address, reg, bytes(data_p[:length]), addrsize=addrsize)
+        return 0
+
+    def smbus_i2c_read(self, address, reg, data_p, length, addrsize=8):
+        buf = bytearray(length)
+        self.readfrom_mem_into(address, reg, buf, addrsize=addrsize)
+        data_p[:length] = buf
+        return 0
     
     def write8(self, addr, reg, data):
         if reg is None:
@@ -157,11 +346,240 @@ class I2CUnifiedLinux(I2CBase):
         regInt = int.from_bytes(reg, 'big')
         return self.i2c.read_word_data(addr, regInt).to_bytes(2, byteorder='little', signed=False)
 
-def create_unified_i2c(bus=None, freq=None, sda=None, scl=None, suppress_warnings=True):
-    if _SYSNAME == 'microbit':
-        i2c = I2CUnifiedMicroBit(freq=freq)
-    elif _SYSNAME == 'Linux':
-        i2c = I2CUnifiedLinux(bus=bus, suppress_warnings=suppress_warnings)
+class I2CLocked(I2CBase):
+    # A unified handle shared between threads: every call, and every batch
+    # as a whole, holds the lock, so transactions from different threads
+    # never interleave. Use batch() to keep several operations together.
+    # asyncio tasks need no lock, an I2C call never yields.
+    def __init__(self, bus, lock):
+        self.bus = bus
+        self.lock = lock
+
+    def __getattr__(self, name):
+        return getattr(self.bus, name)
+
+    def writeto_mem(self, addr, memaddr, buf, *, addrsize=8):
+        with self.lock:
+            return self.bus.writeto_mem(addr, memaddr, buf, addrsize=addrsize)
+
+    def readfrom_mem(self, addr, memaddr, nbytes, *, addrsize=8):
+        with self.lock:
+            return self.bus.readfrom_mem(addr, memaddr, nbytes, addrsize=addrsize)
+
+    def readfrom_mem_into(self, addr, memaddr, buf, *, addrsize=8):
+        with self.lock:
+            return self.bus.readfrom_mem_into(addr, memaddr, buf, addrsize=addrsize)
+
+    def writeto(self, addr, buf, stop=True):
+        with self.lock:
+            return self.bus.writeto(addr, buf, stop)
+
+    def writevto(self, addr, vector, stop=True):
+        with self.lock:
+            return self.bus.writevto(addr, vector, stop)
+
+    def readfrom_into(self, addr, buf, stop=True):
+        with self.lock:
+            return self.bus.readfrom_into(addr, buf, stop)
+
+    def readfrom(self, addr, nbytes, stop=True):
+        with self.lock:
+            return self.bus.readfrom(addr, nbytes, stop)
+
+    def write8(self, addr, reg, data):
+        with self.lock:
+            return self.bus.write8(addr, reg, data)
+
+    def read16(self, addr, reg):
+        with self.lock:
+            return self.bus.read16(addr, reg)
+
+    def run_batch(self, ops):
+        with self.lock:
+            self.bus.run_batch(ops)
+
+# upper bounds of the latency histogram buckets in us; the last bucket
+# counts everything slower
+LATENCY_US = (50, 100, 200, 500, 1000, 2000, 5000)
+
+class I2CStats(I2CBase):
+    # Counts the traffic through a unified handle or a machine.I2C (e.g.
+    # the one given to SSD1306_I2C), per device address: transactions,
+    # bytes in and out, errors and a ticks_us latency histogram. A batch
+    # counts as one transaction of its first address. Made by instrument().
+    def __init__(self, bus):
+        self.bus = bus
+        self._stats = {}  # addr: [transactions, in, out, errors, *histogram]
+
+    def __getattr__(self, name):
+        return getattr(self.bus, name)
+
+    def _count(self, addr, start, rx, tx, failed=False):
+        us = ticks_diff(ticks_us(), start)
+        entry = self._stats.get(addr)
+        if entry is None:
+            entry = self._stats[addr] = [0] * (5 + len(LATENCY_US))
+        entry[0] += 1
+        if failed:
+            entry[3] += 1
+        else:
+            entry[1] += rx
+            entry[2] += tx
+        i = 4
+        for bound in LATENCY_US:
+            if us <= bound:
+                break
+            i += 1
+        entry[i] += 1
+
+    def stats(self):
+        # {'3C': {'n': .., 'in': .., 'out': .., 'err': .., 'us': [..]}},
+        # 'us' counting transactions per LATENCY_US bucket
+        return {'{:02X}'.format(addr): {'n': e[0], 'in': e[1], 'out': e[2], 'err': e[3], 'us': e[4:]}
+                for addr, e in self._stats.items()}
+
+    def reset(self):
+        self._stats.clear()
+
+    def writeto_mem(self, addr, memaddr, buf, *, addrsize=8):
+        start = ticks_us()
+        try:
+            result = self.bus.writeto_mem(addr, memaddr, buf, addrsize=addrsize)
+        except:
+            self._count(addr, start, 0, 0, True)
+            raise
+        self._count(addr, start, 0, addrsize // 8 + len(buf))
+        return result
+
+    def readfrom_mem(self, addr, memaddr, nbytes, *, addrsize=8):
+        start = ticks_us()
+        try:
+            result = self.bus.readfrom_mem(addr, memaddr, nbytes, addrsize=addrsize)
+        except:
+            self._count(addr, start, 0, 0, True)
+            raise
+        self._count(addr, start, nbytes, addrsize // 8)
+        return result
+
+    def readfrom_mem_into(self, addr, memaddr, buf, *, addrsize=8):
+        start = ticks_us()
+        try:
+            result = self.bus.readfrom_mem_into(addr, memaddr, buf, addrsize=addrsize)
+        except:
+            self._count(addr, start, 0, 0, True)
+            raise
+        self._count(addr, start, len(buf), addrsize // 8)
+        return result
+
+    def writeto(self, addr, buf, stop=True):
+        start = ticks_us()
+        try:
+            result = self.bus.writeto(addr, buf, stop)
+        except:
+            self._count(addr, start, 0, 0, True)
+            raise
+        self._count(addr, start, 0, len(buf))
+        return result
+
+    def writevto(self, addr, vector, stop=True):
+        start = ticks_us()
+        try:
+            result = self.bus.writevto(addr, vector, stop)
+        except:
+            self._count(addr, start, 0, 0, True)
+            raise
+        n = 0
+        for buf in vector:
+            n += len(buf)
+        self._count(addr, start, 0, n)
+        return result
+
+    def readfrom_into(self, addr, buf, stop=True):
+        start = ticks_us()
+        try:
+            result = self.bus.readfrom_into(addr, buf, stop)
+        except:
+            self._count(addr, start, 0, 0, True)
+            raise
+        self._count(addr, start, len(buf), 0)
+        return result
+
+    def readfrom(self, addr, nbytes, stop=True):
+        start = ticks_us()
+        try:
+            result = self.bus.readfrom(addr, nbytes, stop)
+        except:
+            self._count(addr, start, 0, 0, True)
+            raise
+        self._count(addr, start, nbytes, 0)
+        return result
+
+    def run_batch(self, ops):
+        rx = tx = 0
+        for is_read, addr, memaddr, buf, addrsize in ops:
+            tx += addrsize // 8
+            if is_read:
+                rx += len(buf)
+            else:
+                tx += len(buf)
+        addr = ops[0][1]
+        start = ticks_us()
+        try:
+            self.bus.run_batch(ops)
+        except:
+            self._count(addr, start, 0, 0, True)
+            raise
+        self._count(addr, start, rx, tx)
+
+def instrument(i2c, enabled=True):
+    # i2c wrapped in an I2CStats if enabled, else i2c itself, so that the
+    # instrumentation costs nothing when it is off
+    if not enabled or isinstance(i2c, I2CStats):
+        return i2c
+    return I2CStats(i2c)
+
+_buses = {}  # shared handles, see create_unified_i2c
+
+def _pin_id(pin):
+    # Pin objects made separately for the same pin are different objects;
+    # key on the pin named in the repr, 'Pin(GPIO4, mode=...)' -> 'Pin(GPIO4'
+    if pin is None or isinstance(pin, int):
+        return pin
+    return str(pin).split(',')[0].rstrip(')')
+
+def create_unified_i2c(bus=None, freq=None, sda=None, scl=None, suppress_warnings=True, i2c=None, lock=None, shared=True):
+    # Returns the handle already made for the same bus, pins and freq, or
+    # for the same existing bus object passed as i2c, so that every driver
+    # on a bus shares one configured peripheral instead of initialising it
+    # again. i2c may also be a unified handle, which is used as it is.
+    # lock=True (or a lock object) makes the shared handle take that lock
+    # around every transaction; ask for it before starting other threads.
+    # shared=False always makes a new handle.
+    if isinstance(i2c, I2CBase):
+        key = id(i2c)
+        handle = _buses.get(key, i2c) if shared else i2c
     else:
-        i2c = I2CUnifiedMachine(bus=bus, freq=freq, sda=sda, scl=scl)
-    return i2c
+        if i2c is not None:
+            key = id(i2c)
+        elif _SYSNAME == 'microbit':
+            key = _SYSNAME
+        elif _SYSNAME == 'Linux':
+            key = 1 if bus is None else bus
+        else:
+            key = (bus, freq, _pin_id(sda), _pin_id(scl))
+        handle = _buses.get(key) if shared else None
+        if handle is None:
+            if _SYSNAME == 'microbit':
+                handle = I2CUnifiedMicroBit(freq=freq)
+            elif _SYSNAME == 'Linux':
+                handle = I2CUnifiedLinux(bus=bus, suppress_warnings=suppress_warnings, i2c=i2c)
+            else:
+                handle = I2CUnifiedMachine(bus=bus, freq=freq, sda=sda, scl=scl, i2c=i2c)
+    if lock and not isinstance(handle, I2CLocked):
+        if lock is True:
+            from _thread import allocate_lock
+            lock = allocate_lock()
+        handle = I2CLocked(handle, lock)
+    if shared:
+        _buses[key] = handle
+    return handle
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Time PiicoDev_Unified's Linux backend against the list-based version it
+replaced, on the in-process smbus2 from fake_smbus2.py.
+
+The fake bus does no I/O and the device behind it does nothing, so the
+times are the Python overhead of building and unpacking messages: an ENS160-sized register read and write, and a
+full SSD1306 frame sent with writevto(), and two register reads as
+separate calls against one batch(), plain and through instrument(). The SSD1306 and ENS160 drivers
+then run unchanged on the new backend, the display through a device
+that decodes the stream into the ssd1306_emu display RAM.
+
+    python3 tools/bench_i2c_linux.py --iterations 20000
+"""
+
+import argparse
+import time
+
+import fake_smbus2
+import ssd1306_emu
+
+fake_smbus2.install()
+ssd1306_emu.install("air_qual_disp/lib")
+
+from PiicoDev_Unified import I2CUnifiedLinux, i2c_msg, instrument  # noqa: E402
+
+
+class ListPath(I2CUnifiedLinux):
+    # readfrom_mem/writeto_mem as they were: payloads copied through lists
+    def readfrom_mem(self, addr, memaddr, nbytes, *, addrsize=8):
+        data = [None] * nbytes
+        msg_w = i2c_msg.write(addr, [memaddr])
+        msg_r = i2c_msg.read(addr, nbytes)
+        self.i2c.i2c_rdwr(msg_w, msg_r)
+        for index in range(nbytes):
+            data[index] = ord(msg_r.buf[index])
+        return data
+
+    def writeto_mem(self, addr, memaddr, buf, *, addrsize=8):
+        data = []
+        for index in range(len(buf)):
+            data.append(buf[index])
+        self.i2c.i2c_rdwr(i2c_msg.write(addr, [memaddr] + data))
+
+    def writevto(self, addr, vector, stop=True):
+        # what a driver had to do without writevto(): join, then list copy
+        data = b"".join(bytes(v) for v in vector)
+        self.i2c.i2c_rdwr(i2c_msg.write(addr, list(data)))
+
+
+class NullDevice:
+    # answers every read with zeros and drops writes, so only the
+    # backend's own work is timed
+    def __init__(self):
+        self.zeros = bytes(64)
+
+    def write(self, data):
+        pass
+
+    def read(self, n):
+        return self.zeros[:n]
+
+
+class SSD1306Device:
+    # I2C side of an SSD1306: control byte, then commands or display data
+    def __init__(self, display):
+        self.display = display
+
+    def write(self, data):
+        if data[0] & 0x40:
+            self.display.data(data[1:])
+        else:
+            for byte in data[1:]:
+                self.display.command(byte)
+
+    def read(self, n):
+        return bytes(n)
+
+
+def timed(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PiicoDev_Unified Linux backend benchmark")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    fake_smbus2.DEVICES[0x53] = NullDevice()
+    fake_smbus2.DEVICES[0x3C] = NullDevice()
+    frame = bytearray(range(256)) * 4
+    into = bytearray(6)
+    word = bytearray(b"\x12\x34")
+
+    print("{:<28}{:>12}{:>12}".format("operation (us/call)", "before", "after"))
+    old, new = ListPath(), I2CUnifiedLinux()
+    rows = (
+        ("readfrom_mem 6 bytes", lambda b: b.readfrom_mem(0x53, 0x20, 6)),
+        ("writeto_mem 2 bytes", lambda b: b.writeto_mem(0x53, 0x13, word)),
+        ("writevto 1 + 1024 bytes", lambda b: b.writevto(0x3C, (b"\x40", frame))),
+    )
+    for name, op in rows:
+        print("{:<28}{:>12.1f}{:>12.1f}".format(name, timed(lambda: op(old), args.iterations), timed(lambda: op(new), args.iterations)))
+    print("{:<28}{:>12}{:>12.1f}".format("readfrom_mem_into 6 bytes", "-", timed(lambda: new.readfrom_mem_into(0x53, 0x20, into), args.iterations)))
+
+    # two register reads, as separate calls and as one batch
+    comp = bytearray(4)
+
+    def separate():
+        new.readfrom_mem_into(0x53, 0x20, into)
+        new.readfrom_mem_into(0x53, 0x30, comp)
+
+    def batched():
+        with new.batch() as b:
+            b.read(0x53, 0x20, into)
+            b.read(0x53, 0x30, comp)
+
+    print("{:<28}{:>12.1f}{:>12.1f}".format("2 reads, calls vs batch", timed(separate, args.iterations), timed(batched, args.iterations)))
+    counted = instrument(new)
+    assert instrument(new, False) is new
+    print("{:<28}{:>12.1f}{:>12.1f}".format("readfrom_mem_into, counted", timed(lambda: new.readfrom_mem_into(0x53, 0x20, into), args.iterations), timed(lambda: counted.readfrom_mem_into(0x53, 0x20, into), args.iterations)))
+
+    # the drivers, unchanged, on the new backend
+    fake_smbus2.DEVICES[0x53] = registers = fake_smbus2.RegisterDevice()
+    new.writeto_mem(0x53, 0x13, word)
+    assert bytes(old.readfrom_mem(0x53, 0x13, 2)) == new.readfrom_mem(0x53, 0x13, 2) == bytes(word)
+    new.i2c.reset_counts()
+    with new.batch() as b:
+        b.write(0x53, 0x15, b"\x0a\x0b")
+        got = b.read(0x53, 0x13, 4)
+    assert new.i2c.transfers == 1 and new.i2c.messages == 3, (new.i2c.transfers, new.i2c.messages)
+    assert bytes(got) == bytes(word) + b"\x0a\x0b"
+    print("batch of 1 write + 1 read: {} i2c_rdwr call, {} messages".format(new.i2c.transfers, new.i2c.messages))
+
+    # past the kernel's 42 messages per call a batch is split between
+    # operations: every call ends with a read, never with a register write
+    calls = []
+    rdwr = new.i2c.i2c_rdwr
+    new.i2c.i2c_rdwr = lambda *msgs: calls.append([m.flags for m in msgs]) or rdwr(*msgs)
+    with new.batch() as b:
+        b.write(0x53, 0x15, b"\x0a")
+        for reg in range(21):
+            b.read(0x53, reg, 2)
+    del new.i2c.i2c_rdwr
+    assert [len(c) for c in calls] == [41, 2] and all(c[-1] for c in calls), calls
+    display = ssd1306_emu.SSD1306Emu()
+    fake_smbus2.DEVICES[0x3C] = SSD1306Device(display)
+    from ssd1306 import SSD1306_I2C
+    counted.reset()
+    oled = SSD1306_I2C(128, 64, counted)
+    oled.fill(0)
+    oled.rect(10, 10, 100, 40, 1)
+    oled.show()
+    assert display.frame() == oled.buffer, "display RAM differs from the driver buffer"
+    print("SSD1306_I2C show(): display RAM matches the frame buffer")
+    with counted.batch() as b:
+        b.read(0x53, 0x13, 2)
+    try:
+        counted.writeto(0x50, b"\x00")  # nothing at 0x50
+    except OSError:
+        pass
+    stats = counted.stats()
+    assert stats["3C"]["out"] >= len(oled.buffer) and stats["53"]["in"] == 2 and stats["50"]["err"] == 1, stats
+    print("instrumented:", stats)
+
+
+if __name__ == "__main__":
+    main()
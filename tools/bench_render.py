@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Replay the display render paths on the emulated SSD1306 and report
+bus traffic per frame.
+
+The scenarios mirror the drawing code of air_qual_mqtt/main.py (the
+SHOW_IP, SHOW_SENSOR and ANIMATION2 states, with the same driver options:
+shadow and double buffer, each frame present()ed and sent by pump() calls
+every DISPLAY_PUMP_MS) and the bw_scroll logo loop, both the column feed
+it uses now (with content scroll, and the redraw fallback for controllers
+without it) and the full-frame blit + show() it replaced. For each one
+the report gives transactions, bytes and estimated bus time per frame,
+the frame rate the bus alone would allow and, for the pumped scenarios,
+pump() calls per frame and the most bytes one call put on the bus.
+
+    python3 tools/bench_render.py --freq 400000 --dump /tmp/frames
+"""
+
+import argparse
+import os
+
+import ssd1306_emu
+
+ssd1306_emu.install("air_qual_disp/lib", "air_qual_mqtt/lib", "bw_scroll/lib")
+
+from oled_layout import Layout  # noqa: E402
+from ssd1306 import CHUNK, SSD1306_I2C  # noqa: E402
+from vlz import VLZStream  # noqa: E402
+
+WIDTH = 128
+HEIGHT = 64
+LOGO = os.path.join(ssd1306_emu.ROOT, "bw_scroll", "bw_logo.vlz")
+PUMP_MS = 5  # air_qual_mqtt DISPLAY_PUMP_MS, the pump() timer period
+
+# (operation, AQI, TVOC, eCO2, temperature F) per SHOW_SENSOR cycle
+SAMPLES = [
+    ("operating ok", 2, 143, 612, 71.2),
+    ("operating ok", 2, 143, 612, 71.2),
+    ("operating ok", 2, 151, 618, 71.3),
+    ("operating ok", 3, 388, 905, 71.3),
+    ("operating ok", 3, 402, 911, 71.4),
+]
+
+
+def new_display(freq, **options):
+    bus = ssd1306_emu.EmuI2C(freq=freq)
+    oled = SSD1306_I2C(WIDTH, HEIGHT, bus, **options)
+    return bus, oled
+
+
+def presenter(bus, oled, pumps):
+    # present() the frame, then pump(CHUNK) until it is sent, PUMP_MS of
+    # virtual time apart like the timer in air_qual_mqtt; the bus bytes of
+    # every pump() call go to pumps
+    def send():
+        oled.present()
+        while True:
+            before = bus.bytes
+            more = oled.pump(CHUNK)
+            pumps.append(bus.bytes - before)
+            if not more:
+                break
+            ssd1306_emu.CLOCK.sleep_ms(PUMP_MS)
+
+    return send
+
+
+def show_ip(oled, send):
+    oled.poweron()
+    oled.fill(0)
+    oled.text("IP Address:", 0, 20)
+    oled.text("192.168.1.57", 0, 35)
+    send()
+    yield
+
+
+def sensor_layout(oled):
+    # same layout as air_qual_mqtt.sensor_layout()
+    layout = Layout(oled)
+    layout.label(" AQI:", 0, 20)
+    layout.label("TVOC:", 0, 30)
+    layout.label("eCO2:", 0, 40)
+    layout.label("Temp:", 0, 50)
+    layout.label("o", 88, 45)
+    layout.label("F", 96, 50)
+    layout.field("status", 0, 8, WIDTH // 8)
+    layout.field("aqi", 48, 20, 5)
+    layout.field("tvoc", 48, 30, 5)
+    layout.field("eco2", 48, 40, 5)
+    layout.field("temp", 48, 50, 5)
+    layout.field("trend", 96, 40, 1)
+    return layout
+
+
+def show_sensor(oled, send):
+    layout = sensor_layout(oled)
+    for operation, aqi, tvoc, eco2, temp_f in SAMPLES:
+        oled.contrast(64)
+        oled.fill(0)
+        layout.draw()
+        layout.set("status", operation)
+        layout.set("aqi", aqi)
+        layout.set("tvoc", tvoc)
+        layout.set("eco2", eco2)
+        layout.set("temp", round(temp_f, 1))
+        layout.set("trend", "=")
+        send()
+        yield
+
+
+def animation2(oled, send, frames=100):
+    oled.poweron()
+    oled.fill(0)
+    send()
+    box_x, box_y = 0, 0
+    box_dx, box_dy = 3, 3
+    box_w, box_h = 16, 8
+    for _ in range(frames):
+        oled.fill_rect(box_x, box_y, box_w, box_h, 0)
+        box_x += box_dx
+        box_y += box_dy
+        if box_x <= 0 or box_x + box_w >= WIDTH:
+            box_dx = -box_dx
+        if box_y <= 0 or box_y + box_h >= HEIGHT:
+            box_dy = -box_dy
+        oled.fill_rect(box_x, box_y, box_w, box_h, 1)
+        send()
+        yield
+
+
+def scroll_feed(oled, send):
+    logo = VLZStream(LOGO)
+    column = bytearray(logo.pages)
+    oled.fill(0)
+    send()
+    for i in range(logo.width + 32):
+        if i < logo.width:
+            logo.read_into(column)
+        else:
+            column[:] = bytes(len(column))
+        while not oled.feed_column(column):
+            ssd1306_emu.CLOCK.sleep_ms(1)
+        yield
+    logo.close()
+
+
+def scroll_blit(oled, send):
+    # the previous loop: blit the whole logo at x and show() every step
+    logo = VLZStream(LOGO)
+    columns = bytearray(logo.width * logo.pages)
+    logo.read_into(columns)
+    logo.close()
+    pages = logo.pages
+    image = bytearray(len(columns))  # column ordered -> page ordered
+    for x in range(logo.width):
+        for page in range(pages):
+            image[page * logo.width + x] = columns[x * pages + page]
+    for x in range(WIDTH, -520, -1):
+        oled.fill(0)
+        oled.blit_pages(image, logo.width, x)
+        send()
+        yield
+
+
+SCENARIOS = [
+    ("SHOW_IP", show_ip, {"shadow": True, "double_buffer": True}),
+    ("SHOW_SENSOR", show_sensor, {"shadow": True, "double_buffer": True}),
+    ("ANIMATION2", animation2, {"shadow": True, "double_buffer": True}),
+    ("bw_scroll feed", scroll_feed, {}),
+    ("bw_scroll redraw", scroll_feed, {"content_scroll": False}),
+    ("bw_scroll blit", scroll_blit, {}),
+]
+
+
+def run(name, scenario, options, freq, dump=None):
+    bus, oled = new_display(freq, **options)
+    pumps = []
+    send = presenter(bus, oled, pumps) if options.get("double_buffer") else oled.show
+    bus.reset()
+    start_us = ssd1306_emu.CLOCK.us
+    frames = 0
+    for _ in scenario(oled, send):
+        frames += 1
+    elapsed_us = ssd1306_emu.CLOCK.us - start_us
+    # feed_column() keeps the buffer in step with display RAM as well
+    assert bus.display.frame() == oled.buffer, "{}: display RAM differs from the driver buffer".format(name)
+    if dump:
+        bus.display.save(os.path.join(dump, name.replace(" ", "_") + ".png"), scale=2)
+    per_frame_us = bus.bus_us / frames
+    return {
+        "name": name,
+        "frames": frames,
+        "tx": bus.transactions / frames,
+        "bytes": bus.bytes / frames,
+        "bus_ms": per_frame_us / 1000,
+        "fps": 1000000 / per_frame_us if per_frame_us else float("inf"),
+        "elapsed_s": elapsed_us / 1000000,
+        "pumps": "{:.1f}".format(len(pumps) / frames) if pumps else "-",
+        "pump_max": max(pumps) if pumps else "-",
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SSD1306 render path bus benchmark")
+    parser.add_argument("--freq", type=int, default=400000, help="I2C clock in Hz")
+    parser.add_argument("--dump", help="directory for a PNG of each scenario's last frame")
+    args = parser.parse_args(argv)
+    if args.dump:
+        os.makedirs(args.dump, exist_ok=True)
+
+    print("I2C at {} Hz".format(args.freq))
+    print("{:<16}{:>7}{:>8}{:>10}{:>10}{:>10}{:>10}{:>9}{:>11}".format(
+        "scenario", "frames", "tx/f", "bytes/f", "bus ms/f", "max fps", "run s", "pumps/f", "max B/pump"))
+    for name, scenario, options in SCENARIOS:
+        r = run(name, scenario, options, args.freq, args.dump)
+        print("{name:<16}{frames:>7}{tx:>8.1f}{bytes:>10.1f}{bus_ms:>10.2f}{fps:>10.1f}{elapsed_s:>10.2f}{pumps:>9}{pump_max:>11}".format(**r))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Check that the PiicoDev_ENS160 sample loop does not grow the heap.
+
+The driver runs against the ENS160Model from ens160_sim.py through a
+stand-in bus that implements readfrom_mem_into()/writeto_mem() directly
+on the register file, so only the driver's own allocations are traced.
+After a warm-up, N cycles of read_all(into=...) plus the aqi, tvoc, eco2
+and operation properties must leave no memory allocated by the driver
+once the cycle's temporaries are collected. The largest transient
+allocation per cycle is reported as well; on CPython it includes int
+objects above 256 that MicroPython stores as small ints without
+allocating.
+
+    python3 tools/ens160_heap.py --cycles 1000
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from array import array
+
+import ens160_sim
+
+# cycles before tracing starts: first eco2 tuples, bound methods, and on
+# CPython the cache counters passing 256, after which each is one int object
+WARMUP = 100
+
+
+class RegisterBus:
+    # machine.I2C subset used by the driver, backed by a register model
+    def __init__(self, model):
+        self.model = model
+
+    def readfrom_mem_into(self, addr, memaddr, buf, *, addrsize=8):
+        for i in range(len(buf)):
+            buf[i] = self.model.read_reg(memaddr + i)
+
+    def writeto_mem(self, addr, memaddr, buf, *, addrsize=8):
+        for i in range(len(buf)):
+            self.model.write_reg(memaddr + i, buf[i])
+
+
+def traced(snapshot, driver):
+    return sum(stat.size for stat in snapshot.filter_traces([tracemalloc.Filter(True, driver)]).statistics("filename"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PiicoDev_ENS160 heap growth check")
+    parser.add_argument("--cycles", type=int, default=1000, help="sample cycles to trace")
+    args = parser.parse_args(argv)
+
+    ens160_sim.install(ens160_sim.Scheduler())
+    import PiicoDev_ENS160 as driver
+
+    model = ens160_sim.ENS160Model()
+    bus = RegisterBus(model)
+    driver.create_unified_i2c = lambda **kwargs: bus
+    sensor = driver.PiicoDev_ENS160(max_age_ms=0)  # the clock does not advance here
+    raw = array('H', [0] * 6)
+    values = list(ens160_sim.measurements(args.cycles + WARMUP))
+
+    def cycle(i):
+        model.step(*values[i])
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        sensor.read_all(into=raw)
+        sensor.aqi, sensor.tvoc, sensor.eco2, sensor.operation
+        return tracemalloc.get_traced_memory()[1] - start
+
+    tracemalloc.start()
+    for i in range(WARMUP):
+        cycle(i)
+    gc.collect()
+    before = traced(tracemalloc.take_snapshot(), driver.__file__)
+    peak = max(cycle(i) for i in range(WARMUP, WARMUP + args.cycles))
+    gc.collect()
+    after = traced(tracemalloc.take_snapshot(), driver.__file__)
+    tracemalloc.stop()
+
+    print("{} cycles: {} bytes retained by the driver, largest transient allocation {} bytes per cycle".format(
+        args.cycles, after - before, peak))
+    if after != before:
+        sys.exit("heap grew across sample cycles")
+
+
+if __name__ == "__main__":
+    main()
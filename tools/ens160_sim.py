@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Run PiicoDev_ENS160 against a simulated sensor on the host.
+
+ENS160Model is a register model of the sensor behind the fake smbus2
+bus (tools/fake_smbus2.py), so the driver runs unmodified through
+PiicoDev_Unified's Linux backend. step() publishes a new measurement
+and sets NEWDAT; reading the data registers clears it. With INTEN and
+INTDAT set in CONFIG the model drives an INT pin from NEWDAT, and
+micropython.schedule() is a queue drained between steps the way the
+MicroPython VM runs scheduled callbacks between bytecodes.
+
+In polling mode the loop also sets the temperature compensation every
+cycle, as air_qual_mqtt does, to show the writes the register cache
+skips. The run checks that polling with the sample cache still sees every
+measurement and that every measurement reaches the sample ring once and
+in order, and compares bus transactions per consumer read in polling
+and interrupt mode.
+
+    python3 tools/ens160_sim.py --cycles 200 --readers 3
+"""
+
+import argparse
+import os
+import sys
+import types
+
+import fake_smbus2
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+ADDRESS = 0x53
+NEWDAT = 0x02
+STATAS = 0x80
+
+
+class ENS160Model(fake_smbus2.RegisterDevice):
+    def __init__(self, pin=None):
+        super().__init__()
+        self.regs[0x00:0x02] = (0x0160).to_bytes(2, "little")
+        self.pin = pin
+        self.published = []
+
+    def _int_asserted(self):
+        config = self.regs[0x11]
+        return config & 0x01 and config & 0x02 and self.regs[0x20] & NEWDAT
+
+    def _drive_pin(self):
+        if self.pin is not None:
+            polarity = self.regs[0x11] >> 6 & 1
+            self.pin.drive(polarity if self._int_asserted() else 1 - polarity)
+
+    def write_reg(self, reg, value):
+        super().write_reg(reg, value)
+        if reg == 0x11:
+            self._drive_pin()
+
+    def read_reg(self, reg):
+        value = self.regs[reg]
+        if 0x21 <= reg <= 0x25 and self.regs[0x20] & NEWDAT:
+            self.regs[0x20] &= ~NEWDAT & 0xFF
+            self._drive_pin()
+        return value
+
+    def step(self, aqi, tvoc, eco2):
+        self.regs[0x21] = aqi
+        self.regs[0x22:0x24] = tvoc.to_bytes(2, "little")
+        self.regs[0x24:0x26] = eco2.to_bytes(2, "little")
+        self.regs[0x20] = STATAS | NEWDAT  # validity 0: operating ok
+        self.published.append((aqi, tvoc, eco2))
+        self._drive_pin()
+
+
+class FakePin:
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self):
+        self.level = 1
+        self.handler = None
+        self.trigger = 0
+
+    def value(self):
+        return self.level
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING):
+        self.handler = handler
+        self.trigger = trigger
+
+    def drive(self, level):
+        edge = self.IRQ_RISING if level > self.level else self.IRQ_FALLING if level < self.level else 0
+        self.level = level
+        if edge & self.trigger and self.handler is not None:
+            self.handler(self)
+
+
+class Scheduler:
+    # micropython.schedule() with the firmware's fixed-depth queue
+    def __init__(self, depth=8):
+        self.depth = depth
+        self.queue = []
+        self.ms = 0
+
+    def schedule(self, func, arg):
+        if len(self.queue) >= self.depth:
+            raise RuntimeError("schedule queue full")
+        self.queue.append((func, arg))
+
+    def run_pending(self):
+        while self.queue:
+            func, arg = self.queue.pop(0)
+            func(arg)
+
+    def ticks_ms(self):
+        return self.ms
+
+
+def install(scheduler):
+    # modules the driver imports on MicroPython, backed by the simulation
+    fake_smbus2.install()
+    micropython = types.ModuleType("micropython")
+    micropython.schedule = scheduler.schedule
+    micropython.const = lambda x: x
+    utime = types.ModuleType("utime")
+    utime.ticks_ms = scheduler.ticks_ms
+    utime.ticks_diff = lambda a, b: a - b
+    utime.sleep_ms = lambda ms: None
+    sys.modules["micropython"] = micropython
+    sys.modules["utime"] = utime
+    sys.path.insert(0, os.path.join(ROOT, "air_qual_disp", "lib"))
+
+
+def measurements(cycles):
+    for i in range(cycles):
+        yield 1 + i % 5, (37 * i) % 1000, 400 + (53 * i) % 1200
+
+
+def run_polling(driver_cls, scheduler, cycles, readers, max_age_ms):
+    fake_smbus2.DEVICES[ADDRESS] = model = ENS160Model()
+    sensor = driver_cls(max_age_ms=max_age_ms)
+    fake_smbus2.SMBus.reset_counts()
+    seen = []
+    for i, values in enumerate(measurements(cycles)):
+        scheduler.ms += 1000
+        model.step(*values)
+        # compensation as air_qual_mqtt sets it, a slowly drifting room temperature
+        sensor.temperature = 21.5 + (i // 30) * 0.01
+        for _ in range(readers):
+            seen.append((sensor.aqi.value, sensor.tvoc, sensor.eco2.value))
+    assert seen[readers - 1::readers] == model.published, "polling missed a measurement"
+    return fake_smbus2.SMBus.transfers, sensor
+
+
+def check_max_age(driver_cls, scheduler, max_age_ms):
+    # a value not viewed since the last burst must not be served once the
+    # snapshot is older than max_age_ms
+    fake_smbus2.DEVICES[ADDRESS] = model = ENS160Model()
+    sensor = driver_cls(max_age_ms=max_age_ms)
+    model.step(1, 100, 500)
+    sensor.aqi
+    scheduler.ms += max(max_age_ms, 3600000)
+    model.step(3, 700, 1500)
+    assert sensor.eco2.value == 1500, "eco2 served from a stale snapshot"
+
+
+def run_interrupt(driver_cls, scheduler, cycles, readers, burst, ring_size):
+    pin = FakePin()
+    fake_smbus2.DEVICES[ADDRESS] = model = ENS160Model(pin)
+    sensor = driver_cls(int_pin=pin, ring_size=ring_size)
+    popped = []
+    consumer_transfers = 0
+    values = list(measurements(cycles))
+    for i in range(0, cycles, burst):
+        # several results can arrive before the main loop gets to them
+        for aqi, tvoc, eco2 in values[i:i + burst]:
+            scheduler.ms += 1000
+            model.step(aqi, tvoc, eco2)
+            scheduler.run_pending()
+        before = fake_smbus2.SMBus.transfers
+        while sensor.pending:
+            ticks, sample = sensor.pop()
+            popped.append((sample.aqi, sample.tvoc, sample.eco2))
+        for _ in range(readers):
+            sensor.aqi, sensor.tvoc, sensor.eco2
+        consumer_transfers += fake_smbus2.SMBus.transfers - before
+    # a full ring overwrites its oldest entries; everything else arrives once, in order
+    assert len(popped) + sensor.ring.overruns == len(model.published), "ring lost samples"
+    remaining = iter(model.published)
+    assert all(sample in remaining for sample in popped), "ring reordered samples"
+    assert sensor.dropped == 0
+    return consumer_transfers, sensor
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PiicoDev_ENS160 interrupt mode simulation")
+    parser.add_argument("--cycles", type=int, default=200, help="measurements to publish")
+    parser.add_argument("--readers", type=int, default=3, help="property reads of aqi/tvoc/eco2 per cycle")
+    parser.add_argument("--burst", type=int, default=4, help="measurements between consumer passes")
+    parser.add_argument("--ring", type=int, default=16, help="ring_size passed to the driver")
+    parser.add_argument("--max-age", type=int, default=1000, help="max_age_ms passed to the driver in polling mode")
+    args = parser.parse_args(argv)
+
+    scheduler = Scheduler()
+    install(scheduler)
+    from PiicoDev_ENS160 import PiicoDev_ENS160
+
+    if args.max_age:
+        check_max_age(PiicoDev_ENS160, scheduler, args.max_age)
+    polled, polling = run_polling(PiicoDev_ENS160, scheduler, args.cycles, args.readers, args.max_age)
+    consumer, sensor = run_interrupt(PiicoDev_ENS160, scheduler, args.cycles, args.readers, args.burst, args.ring)
+    reads = args.cycles * args.readers
+    print("{} measurements, {} reads of aqi/tvoc/eco2 each".format(args.cycles, reads))
+    print("polling:   {:>6} bus transfers ({:.2f} per read), cache {} hits / {} misses, "
+          "{} of {} compensation writes skipped".format(
+        polled, polled / reads, polling.cache_hits, polling.cache_misses, polling.writes_skipped, args.cycles))
+    print("interrupt: {:>6} bus transfers from consumers, {} samples through the ring, "
+          "{} overruns, {} dropped".format(consumer, args.cycles - sensor.ring.overruns, sensor.ring.overruns, sensor.dropped))
+
+
+if __name__ == "__main__":
+    main()
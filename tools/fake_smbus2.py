@@ -0,0 +1,123 @@
+"""In-process stand-in for the smbus2 package, host tools only.
+
+install() registers this module as ``smbus2`` so that PiicoDev_Unified's
+Linux backend runs against register models instead of /dev/i2c-N.
+i2c_msg is the same ctypes structure smbus2 uses, so message buffers
+behave as they do with the real package. SMBus counts i2c_rdwr() calls
+and messages, and the devices in DEVICES answer them.
+"""
+
+import sys
+from ctypes import POINTER, Structure, c_char, c_uint16, create_string_buffer, memmove, string_at
+
+I2C_M_RD = 0x0001
+
+DEVICES = {}  # address -> RegisterDevice
+
+
+class RegisterDevice:
+    # 8-bit register file with an auto-incrementing register pointer
+    def __init__(self, size=256):
+        self.regs = bytearray(size)
+        self.pointer = 0
+
+    def read_reg(self, reg):
+        return self.regs[reg]
+
+    def write_reg(self, reg, value):
+        self.regs[reg] = value
+
+    def write(self, data):
+        if not data:
+            return
+        self.pointer = data[0]
+        for value in data[1:]:
+            self.write_reg(self.pointer, value)
+            self.pointer = (self.pointer + 1) % len(self.regs)
+
+    def read(self, n):
+        out = bytearray(n)
+        for i in range(n):
+            out[i] = self.read_reg(self.pointer)
+            self.pointer = (self.pointer + 1) % len(self.regs)
+        return bytes(out)
+
+
+class i2c_msg(Structure):
+    _fields_ = [("addr", c_uint16), ("flags", c_uint16), ("len", c_uint16), ("buf", POINTER(c_char))]
+
+    def __iter__(self):
+        for i in range(self.len):
+            yield ord(self.buf[i])
+
+    def __len__(self):
+        return self.len
+
+    def __bytes__(self):
+        return string_at(self.buf, self.len)
+
+    @staticmethod
+    def read(address, length):
+        arr = create_string_buffer(length)
+        return i2c_msg(addr=address, flags=I2C_M_RD, len=length, buf=arr)
+
+    @staticmethod
+    def write(address, buf):
+        if type(buf) is str:
+            buf = bytes(map(ord, buf))
+        else:
+            buf = bytes(buf)
+        arr = create_string_buffer(buf, len(buf))
+        return i2c_msg(addr=address, flags=0, len=len(arr), buf=arr)
+
+
+class SMBus:
+    transfers = 0  # i2c_rdwr() calls and SMBus transactions, all buses
+    messages = 0
+
+    def __init__(self, bus=None):
+        self.bus = bus
+
+    @classmethod
+    def reset_counts(cls):
+        cls.transfers = 0
+        cls.messages = 0
+
+    def _device(self, addr):
+        try:
+            return DEVICES[addr]
+        except KeyError:
+            raise OSError(121, "Remote I/O error")  # no ACK
+
+    def i2c_rdwr(self, *msgs):
+        SMBus.transfers += 1
+        SMBus.messages += len(msgs)
+        for msg in msgs:
+            device = self._device(msg.addr)
+            if msg.flags & I2C_M_RD:
+                data = device.read(msg.len)
+                memmove(msg.buf, data, msg.len)
+            else:
+                device.write(bytes(msg))
+
+    def write_byte(self, addr, value):
+        SMBus.transfers += 1
+        self._device(addr).write(bytes((value,)))
+
+    def write_byte_data(self, addr, reg, value):
+        SMBus.transfers += 1
+        self._device(addr).write(bytes((reg, value)))
+
+    def read_word_data(self, addr, reg):
+        SMBus.transfers += 1
+        device = self._device(addr)
+        device.write(bytes((reg,)))
+        data = device.read(2)
+        return data[0] | data[1] << 8
+
+    def close(self):
+        pass
+
+
+def install():
+    sys.modules["smbus2"] = sys.modules[__name__]
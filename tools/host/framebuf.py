@@ -0,0 +1,122 @@
+# Pure Python stand-in for the MicroPython framebuf module, host tools only.
+#
+# Covers the MONO_VLSB/MONO_HLSB/MONO_HMSB formats the drivers in this
+# repo use. text() draws placeholder glyphs: every character fills the
+# same 8x8 cell as the device font, with a pattern derived from its code,
+# so layouts and bus traffic match but the lettering does not.
+
+MONO_VLSB = 0
+MVLSB = MONO_VLSB
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+
+class FrameBuffer:
+    def __init__(self, buf, width, height, format, stride=None):
+        self._buf = buf
+        self._w = width
+        self._h = height
+        self._fmt = format
+        self._stride = width if stride is None else stride
+
+    def _index(self, x, y):
+        if self._fmt == MONO_VLSB:
+            return (y >> 3) * self._stride + x, 1 << (y & 7)
+        i = (y * self._stride + x) >> 3
+        bit = x & 7
+        return i, 1 << (7 - bit if self._fmt == MONO_HLSB else bit)
+
+    def _get(self, x, y):
+        i, mask = self._index(x, y)
+        return 1 if self._buf[i] & mask else 0
+
+    def _set(self, x, y, c):
+        i, mask = self._index(x, y)
+        if c:
+            self._buf[i] |= mask
+        else:
+            self._buf[i] &= ~mask & 0xFF
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self._w and 0 <= y < self._h):
+            return None
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+
+    def fill(self, c):
+        if self._fmt == MONO_VLSB and self._stride == self._w:
+            v = 0xFF if c else 0x00
+            for i in range(len(self._buf)):
+                self._buf[i] = v
+        else:
+            self.fill_rect(0, 0, self._w, self._h, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        for yy in range(max(y, 0), min(y + h, self._h)):
+            for xx in range(max(x, 0), min(x + w, self._w)):
+                self._set(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.hline(x, y, w, c)
+        self.hline(x, y + h - 1, w, c)
+        self.vline(x, y, h, c)
+        self.vline(x + w - 1, y, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                return
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def text(self, s, x, y, c=1):
+        for n, ch in enumerate(s):
+            if ch == " ":
+                continue
+            code = ord(ch)
+            for col in range(1, 7):
+                bits = (code * (col + 3)) & 0x7E
+                for row in range(8):
+                    if bits >> row & 1:
+                        self.pixel(x + 8 * n + col, y + row, c)
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+        for yy in range(max(0, -y), min(fbuf._h, self._h - y)):
+            for xx in range(max(0, -x), min(fbuf._w, self._w - x)):
+                c = fbuf._get(xx, yy)
+                if palette is not None:
+                    c = palette.pixel(c, 0)
+                if c != key:
+                    self._set(x + xx, y + yy, c)
+
+    def scroll(self, xstep, ystep):
+        old = [[self._get(x, y) for x in range(self._w)] for y in range(self._h)]
+        for y in range(self._h):
+            for x in range(self._w):
+                sx = x - xstep
+                sy = y - ystep
+                if 0 <= sx < self._w and 0 <= sy < self._h:
+                    self._set(x, y, old[sy][sx])
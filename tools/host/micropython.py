@@ -0,0 +1,10 @@
+# CPython stand-in for the MicroPython micropython module, host tools only
+
+
+def const(x):
+    return x
+
+
+def schedule(func, arg):
+    # no interrupt context on the host, run the callback straight away
+    func(arg)
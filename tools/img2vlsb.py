@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Convert images to SSD1306-native MONO_VLSB byte arrays.
+
+Runs on the host under CPython and writes a MicroPython module with one
+NAME, NAME_W and NAME_H per input. The data is page ordered: byte
+``page * NAME_W + x`` holds rows ``page * 8`` to ``page * 8 + 7`` of
+column ``x``, least significant bit on top, which is the layout of
+``SSD1306.buffer`` so it can be copied with ``SSD1306.blit_pages()``.
+
+Inputs:
+    logo.pbm                   plain (P1) or raw (P4) PBM, 1 = lit
+    logo.png                   any Pillow-readable image, bright = lit
+    image_arrays.py:bw_buffer@616x64
+                               MONO_HLSB bytearray in a Python module
+
+    python3 tools/img2vlsb.py -o bw_scroll/image_vlsb.py \\
+        BW=bw_scroll/image_arrays.py:bw_buffer@616x64
+
+An output ending in .vlz instead gets one image as a PackBits compressed
+file for lib/vlz.py to stream from flash, stored column by column unless
+--pages is given:
+
+    python3 tools/img2vlsb.py -o bw_scroll/bw_logo.vlz \\
+        bw_scroll/image_arrays.py:bw_buffer@616x64
+"""
+
+import argparse
+import ast
+import os
+import struct
+import sys
+
+VLZ_MAGIC = b"VLZ1"
+VLZ_ORDER_PAGES = 0
+VLZ_ORDER_COLUMNS = 1
+
+
+def read_pbm(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    tokens = []
+    pos = 0
+    # magic, width, height; comments run to end of line
+    while len(tokens) < 3:
+        while data[pos:pos + 1].isspace():
+            pos += 1
+        if data[pos:pos + 1] == b"#":
+            pos = data.index(b"\n", pos)
+            continue
+        end = pos
+        while not data[end:end + 1].isspace():
+            end += 1
+        tokens.append(data[pos:end])
+        pos = end
+    magic, width, height = tokens[0], int(tokens[1]), int(tokens[2])
+    if magic == b"P4":
+        pos += 1  # single whitespace before the raster
+        stride = (width + 7) // 8
+        raster = data[pos:pos + stride * height]
+        pixels = [[raster[y * stride + (x >> 3)] >> (7 - (x & 7)) & 1 for x in range(width)] for y in range(height)]
+    elif magic == b"P1":
+        bits = [c - 48 for c in data[pos:] if c in b"01"]
+        pixels = [bits[y * width:(y + 1) * width] for y in range(height)]
+    else:
+        raise ValueError("{}: not a PBM file".format(path))
+    return width, height, pixels
+
+
+def read_png(path):
+    try:
+        from PIL import Image
+    except ImportError:
+        raise SystemExit("PNG input needs Pillow: pip install pillow")
+    img = Image.open(path).convert("L")
+    width, height = img.size
+    lum = img.load()
+    pixels = [[1 if lum[x, y] >= 128 else 0 for x in range(width)] for y in range(height)]
+    return width, height, pixels
+
+
+def read_hlsb_module(spec):
+    # path.py:variable@WxH
+    path, rest = spec.rsplit(":", 1)
+    var, size = rest.split("@")
+    width, height = (int(v) for v in size.lower().split("x"))
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == var for t in node.targets):
+            value = node.value
+            if isinstance(value, ast.Call):  # bytearray(b'...')
+                value = value.args[0]
+            raw = ast.literal_eval(value)
+            break
+    else:
+        raise SystemExit("{}: no variable {}".format(path, var))
+    stride = (width + 7) // 8
+    pixels = [[raw[y * stride + (x >> 3)] >> (7 - (x & 7)) & 1 for x in range(width)] for y in range(height)]
+    return width, height, pixels
+
+
+def read_image(spec):
+    if ".py:" in spec:
+        return read_hlsb_module(spec)
+    ext = os.path.splitext(spec)[1].lower()
+    if ext == ".pbm":
+        return read_pbm(spec)
+    return read_png(spec)
+
+
+def to_vlsb(width, height, pixels, invert=False):
+    pages = (height + 7) // 8
+    out = bytearray(pages * width)
+    for y in range(height):
+        row = pixels[y]
+        bit = 1 << (y & 7)
+        base = (y >> 3) * width
+        for x in range(width):
+            if row[x] ^ invert:
+                out[base + x] |= bit
+    return bytes(out)
+
+
+def to_columns(data, width, pages):
+    # page ordered -> column ordered (x * pages + page)
+    return bytes(data[page * width + x] for x in range(width) for page in range(pages))
+
+
+def packbits(data):
+    out = bytearray()
+    i = 0
+    n = len(data)
+    while i < n:
+        run = 1
+        while i + run < n and run < 128 and data[i + run] == data[i]:
+            run += 1
+        if run >= 2:
+            out.append(257 - run)
+            out.append(data[i])
+            i += run
+            continue
+        # literal run up to the next pair of equal bytes
+        start = i
+        while i < n and i - start < 128 and not (i + 1 < n and data[i + 1] == data[i]):
+            i += 1
+        out.append(i - start - 1)
+        out += data[start:i]
+    return bytes(out)
+
+
+def write_vlz(path, width, height, data, columns=True):
+    pages = (height + 7) // 8
+    if columns:
+        data = to_columns(data, width, pages)
+    order = VLZ_ORDER_COLUMNS if columns else VLZ_ORDER_PAGES
+    packed = packbits(data)
+    with open(path, "wb") as f:
+        f.write(VLZ_MAGIC + struct.pack("<HHBB", width, height, order, 0))
+        f.write(packed)
+    return len(packed)
+
+
+def bytes_literal(data, width=76):
+    body = "".join("\\x{:02X}".format(b) for b in data)
+    step = width - (width % 4)
+    lines = [body[i:i + step] for i in range(0, len(body), step)]
+    return "(\n" + "".join("    b'{}'\n".format(line) for line in lines) + ")"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("inputs", nargs="+", metavar="[NAME=]INPUT")
+    parser.add_argument("-o", "--output", required=True, help="module to write")
+    parser.add_argument("--invert", action="store_true", help="swap lit and dark pixels")
+    parser.add_argument("--pages", action="store_true", help="store .vlz output page by page")
+    args = parser.parse_args(argv)
+
+    if args.output.endswith(".vlz"):
+        if len(args.inputs) != 1:
+            parser.error(".vlz output takes exactly one input")
+        spec = args.inputs[0].split("=", 1)[-1]
+        width, height, pixels = read_image(spec)
+        data = to_vlsb(width, height, pixels, args.invert)
+        size = write_vlz(args.output, width, height, data, columns=not args.pages)
+        print("{}x{}: {} bytes -> {} bytes packed".format(width, height, len(data), size), file=sys.stderr)
+        return
+
+    out = ["# Generated by tools/img2vlsb.py, do not edit", "# MONO_VLSB, page ordered: byte page * W + x is column x of rows page*8..page*8+7", ""]
+    for item in args.inputs:
+        if "=" in item:
+            name, spec = item.split("=", 1)
+        else:
+            spec = item
+            name = os.path.splitext(os.path.basename(spec.split(":")[0]))[0].upper()
+        width, height, pixels = read_image(spec)
+        data = to_vlsb(width, height, pixels, args.invert)
+        out.append("{}_W = {}".format(name, width))
+        out.append("{}_H = {}".format(name, height))
+        out.append("{} = {}".format(name, bytes_literal(data)))
+        out.append("")
+        print("{}: {}x{} -> {} bytes".format(name, width, height, len(data)), file=sys.stderr)
+    with open(args.output, "w") as f:
+        f.write("\n".join(out))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Print a time range of an air_qual_mqtt flash log as CSV.
+
+Copy the log directory off the Pico first, e.g. with
+``mpremote cp -r :log .``, then query it with the same tierlog module the
+device uses:
+
+    python3 tools/logquery.py log --hours 6 --resolution 900
+
+Times are given and printed in UTC; the range ends at the newest record
+unless --end is given.
+"""
+
+import argparse
+import datetime
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "air_qual_mqtt", "lib"))
+
+import tierlog  # noqa: E402
+
+RAW_HEADER = "time,aqi,tvoc,eco2,temp"
+BUCKET_HEADER = "start,count," + ",".join(
+    "{}_{}".format(name, stat) for name in ("aqi", "tvoc", "eco2", "temp") for stat in ("min", "max", "mean"))
+
+
+def iso(t):
+    return datetime.datetime.fromtimestamp(t, datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="query a tierlog directory")
+    parser.add_argument("directory", help="log directory copied from the device")
+    parser.add_argument("--hours", type=float, default=1, help="length of the range")
+    parser.add_argument("--end", help="end of the range, YYYY-MM-DDTHH:MM:SS UTC")
+    parser.add_argument("--resolution", type=int, default=0, help="coarsest acceptable bucket in seconds")
+    args = parser.parse_args(argv)
+
+    # TierLog would create a missing directory
+    if not os.path.isdir(args.directory):
+        parser.error("no such directory: " + args.directory)
+    log = tierlog.TierLog(args.directory)
+    tier = log.tier_for(args.resolution)
+    if args.end:
+        end = int(datetime.datetime.fromisoformat(args.end).replace(tzinfo=datetime.timezone.utc).timestamp()) + 1
+    else:
+        newest = [r[0] for r in tier.records(0, 1 << 32, log._read)]
+        if not newest:
+            return
+        end = newest[-1] + 1
+    start = end - int(args.hours * 3600)
+
+    print(RAW_HEADER if tier.period == 0 else BUCKET_HEADER)
+    temps = 1 if tier.period == 0 else 3
+    for record in tier.records(start, end, log._read):
+        values = [iso(record[0])] + [str(v) for v in record[1:len(record) - temps]]
+        values += ["{:.1f}".format(v / 10) for v in record[len(record) - temps:]]
+        print(",".join(values))
+
+
+if __name__ == "__main__":
+    main()
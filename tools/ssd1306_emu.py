@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""Host-side SSD1306 emulator for the drivers in the project lib folders.
+
+EmuI2C and EmuSPI stand in for machine.I2C and machine.SPI. They decode
+the SSD1306 command/data stream written by lib/ssd1306.py into a virtual
+display RAM, count transactions and bytes and estimate the bus time at
+the configured frequency. The virtual display can be dumped as PBM or PNG.
+
+install() makes the MicroPython-only modules importable under CPython
+(tools/host/framebuf.py and micropython.py) and adds ticks_ms()/ticks_us()/
+ticks_diff()/sleep_ms() to time, driven by a virtual clock that the
+emulated buses advance by their estimated transfer time. Time measured
+with ticks on the host is therefore bus time plus explicit sleeps.
+
+    import ssd1306_emu
+    ssd1306_emu.install("air_qual_disp/lib")
+    from ssd1306 import SSD1306_I2C
+    bus = ssd1306_emu.EmuI2C()
+    oled = SSD1306_I2C(128, 64, bus)
+    oled.text("hello", 0, 0)
+    oled.show()
+    bus.display.save("hello.png")
+"""
+
+import os
+import struct
+import sys
+import time
+import zlib
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+# command -> number of parameter bytes that follow it
+_PARAMS = {
+    0x20: 1,  # memory addressing mode
+    0x21: 2,  # column address
+    0x22: 2,  # page address
+    0x26: 6,  # right horizontal scroll
+    0x27: 6,  # left horizontal scroll
+    0x29: 5,  # vertical and right horizontal scroll
+    0x2A: 5,  # vertical and left horizontal scroll
+    0x2C: 7,  # right content scroll by one column
+    0x2D: 7,  # left content scroll by one column
+    0x81: 1,  # contrast
+    0x8D: 1,  # charge pump
+    0xA3: 2,  # vertical scroll area
+    0xA8: 1,  # multiplex ratio
+    0xD3: 1,  # display offset
+    0xD5: 1,  # clock divide
+    0xD9: 1,  # pre-charge
+    0xDA: 1,  # COM pins
+    0xDB: 1,  # VCOMH deselect
+}
+
+MODE_HORIZONTAL = 0
+MODE_VERTICAL = 1
+MODE_PAGE = 2
+
+
+class Clock:
+    # virtual microsecond clock shared by the emulated buses
+    def __init__(self):
+        self.us = 0
+
+    def advance(self, us):
+        self.us += us
+
+    def ticks_us(self):
+        return int(self.us)
+
+    def ticks_ms(self):
+        return int(self.us) // 1000
+
+    def sleep_ms(self, ms):
+        self.us += ms * 1000
+
+    def sleep_us(self, us):
+        self.us += us
+
+
+CLOCK = Clock()
+
+
+def install(*lib_dirs):
+    # Put the host stand-ins and the given lib folders (relative to the
+    # repo root) on sys.path and give time the MicroPython ticks API.
+    for path in reversed((os.path.join(HERE, "host"),) + tuple(os.path.join(ROOT, d) for d in lib_dirs)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    time.ticks_ms = CLOCK.ticks_ms
+    time.ticks_us = CLOCK.ticks_us
+    time.ticks_diff = lambda a, b: a - b
+    time.ticks_add = lambda a, b: a + b
+    time.sleep_ms = CLOCK.sleep_ms
+    time.sleep_us = CLOCK.sleep_us
+    sys.modules.setdefault("utime", time)
+
+
+class SSD1306Emu:
+    # Display RAM and command decoder of one SSD1306 controller
+    def __init__(self, columns=128, pages=8):
+        self.columns = columns
+        self.pages = pages
+        self.ram = bytearray(columns * pages)
+        self.mode = MODE_PAGE  # reset default
+        self.col_start = 0
+        self.col_end = columns - 1
+        self.page_start = 0
+        self.page_end = pages - 1
+        self.col = 0
+        self.page = 0
+        self.on = False
+        self.inverted = False
+        self.contrast = 0x7F
+        self.charge_pump = False
+        self.scrolling = False
+        self.commands = 0
+        self.data_bytes = 0
+        self._cmd = None
+        self._args = []
+        self._need = 0
+
+    def command(self, byte):
+        self.commands += 1
+        if self._need:
+            self._args.append(byte)
+            self._need -= 1
+            if not self._need:
+                self._execute(self._cmd, self._args)
+            return
+        need = _PARAMS.get(byte, 0)
+        if need:
+            self._cmd = byte
+            self._args = []
+            self._need = need
+        else:
+            self._execute(byte, ())
+
+    def _execute(self, cmd, args):
+        if cmd == 0x20:
+            self.mode = args[0] & 0x03
+        elif cmd == 0x21:
+            self.col_start = self.col = args[0] & 0x7F
+            self.col_end = args[1] & 0x7F
+        elif cmd == 0x22:
+            self.page_start = self.page = args[0] & 0x07
+            self.page_end = args[1] & 0x07
+        elif cmd in (0x2C, 0x2D):
+            self._content_scroll(cmd == 0x2D, args[1] & 0x07, args[3] & 0x07, args[5] & 0x7F, args[6] & 0x7F)
+        elif cmd == 0x2E:
+            self.scrolling = False
+        elif cmd == 0x2F:
+            self.scrolling = True
+        elif cmd == 0x81:
+            self.contrast = args[0]
+        elif cmd == 0x8D:
+            self.charge_pump = bool(args[0] & 0x04)
+        elif cmd in (0xA6, 0xA7):
+            self.inverted = cmd == 0xA7
+        elif cmd in (0xAE, 0xAF):
+            self.on = cmd == 0xAF
+        elif 0xB0 <= cmd <= 0xB7:
+            self.page = cmd & 0x07
+        elif cmd <= 0x0F:
+            self.col = (self.col & 0xF0) | cmd
+        elif cmd <= 0x1F:
+            self.col = (self.col & 0x0F) | (cmd & 0x0F) << 4
+        # remaining commands only affect the panel, not display RAM
+
+    def _content_scroll(self, left, p0, p1, c0, c1):
+        for page in range(p0, p1 + 1):
+            base = page * self.columns
+            row = self.ram[base + c0:base + c1 + 1]
+            if left:
+                row = row[1:] + row[:1]
+            else:
+                row = row[-1:] + row[:-1]
+            self.ram[base + c0:base + c1 + 1] = row
+
+    def data(self, buf):
+        self.data_bytes += len(buf)
+        for byte in buf:
+            self.ram[self.page * self.columns + self.col] = byte
+            if self.mode == MODE_HORIZONTAL:
+                self.col += 1
+                if self.col > self.col_end:
+                    self.col = self.col_start
+                    self.page = self.page + 1 if self.page < self.page_end else self.page_start
+            elif self.mode == MODE_VERTICAL:
+                self.page += 1
+                if self.page > self.page_end:
+                    self.page = self.page_start
+                    self.col = self.col + 1 if self.col < self.col_end else self.col_start
+            else:
+                self.col = self.col + 1 if self.col < self.columns - 1 else 0
+
+    def frame(self, width=128, height=64):
+        # display RAM as the visible MONO_VLSB frame (64 wide panels start at column 32)
+        offset = 32 if width == 64 else 0
+        out = bytearray(width * (height // 8))
+        for page in range(height // 8):
+            src = page * self.columns + offset
+            out[page * width:(page + 1) * width] = self.ram[src:src + width]
+        return out
+
+    def pixels(self, width=128, height=64):
+        frame = self.frame(width, height)
+        rows = [[frame[(y >> 3) * width + x] >> (y & 7) & 1 for x in range(width)] for y in range(height)]
+        if self.inverted:
+            rows = [[1 - p for p in row] for row in rows]
+        return rows
+
+    def save(self, path, width=128, height=64, scale=1):
+        # write the visible frame as .pbm or .png (lit pixels white)
+        rows = self.pixels(width, height)
+        rows = [[p for p in row for _ in range(scale)] for row in rows for _ in range(scale)]
+        w = width * scale
+        h = height * scale
+        if path.endswith(".pbm"):
+            with open(path, "w") as f:
+                f.write("P1\n{} {}\n".format(w, h))
+                for row in rows:
+                    f.write(" ".join("0" if p else "1" for p in row) + "\n")
+            return
+        raw = b"".join(b"\x00" + bytes(255 if p else 0 for p in row) for row in rows)
+
+        def chunk(tag, body):
+            return struct.pack(">I", len(body)) + tag + body + struct.pack(">I", zlib.crc32(tag + body) & 0xFFFFFFFF)
+
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 0, 0, 0, 0)))
+            f.write(chunk(b"IDAT", zlib.compress(raw)))
+            f.write(chunk(b"IEND", b""))
+
+
+class BusStats:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.transactions = 0
+        self.bytes = 0  # bytes on the bus, including I2C address bytes
+        self.bus_us = 0.0
+
+    def snapshot(self):
+        return self.transactions, self.bytes, self.bus_us
+
+
+class EmuI2C(BusStats):
+    # machine.I2C stand-in with an SSD1306 at addr
+    def __init__(self, freq=400000, addr=0x3C, display=None):
+        super().__init__()
+        self.freq = freq
+        self.addr = addr
+        self.display = display or SSD1306Emu()
+
+    def scan(self):
+        return [self.addr]
+
+    def _transfer(self, addr, payload):
+        n = len(payload) + 1  # address byte
+        # 9 clocks per byte plus start and stop conditions
+        us = (9 * n + 2) * 1000000 / self.freq
+        self.transactions += 1
+        self.bytes += n
+        self.bus_us += us
+        CLOCK.advance(us)
+        if addr != self.addr:
+            raise OSError(19)  # ENODEV, nothing acknowledged
+        self._decode(payload)
+
+    def _decode(self, payload):
+        # control bytes: Co (bit 7) = one byte follows, D/C# (bit 6) = data
+        display = self.display
+        i = 0
+        n = len(payload)
+        while i < n:
+            control = payload[i]
+            i += 1
+            if control & 0x80:
+                if i < n:
+                    if control & 0x40:
+                        display.data(payload[i:i + 1])
+                    else:
+                        display.command(payload[i])
+                    i += 1
+                continue
+            if control & 0x40:
+                display.data(payload[i:])
+            else:
+                for byte in payload[i:]:
+                    display.command(byte)
+            return
+
+    def writeto(self, addr, buf, stop=True):
+        self._transfer(addr, bytes(buf))
+        return len(buf)
+
+    def writevto(self, addr, bufs, stop=True):
+        self._transfer(addr, b"".join(bytes(b) for b in bufs))
+
+
+class EmuPin:
+    # machine.Pin stand-in for the SPI control lines
+    OUT = 1
+    IN = 0
+
+    def __init__(self, value=0):
+        self._value = value
+        self.falls = 0
+
+    def init(self, mode=None, value=None):
+        if value is not None:
+            self(value)
+
+    def __call__(self, value=None):
+        if value is None:
+            return self._value
+        if self._value and not value:
+            self.falls += 1
+        self._value = 1 if value else 0
+
+    value = __call__
+
+
+class EmuSPI(BusStats):
+    # machine.SPI stand-in wired to an SSD1306 through dc and cs pins
+    def __init__(self, dc, cs, baudrate=10 * 1024 * 1024, display=None):
+        super().__init__()
+        self.dc = dc
+        self.cs = cs
+        self.baudrate = baudrate
+        self.inits = 0
+        self.display = display or SSD1306Emu()
+        self._falls = cs.falls
+
+    def init(self, baudrate=None, polarity=0, phase=0, **kwargs):
+        self.inits += 1
+        if baudrate:
+            self.baudrate = baudrate
+
+    def write(self, buf):
+        if self.cs():
+            return  # not selected
+        buf = bytes(buf)
+        us = 8 * len(buf) * 1000000 / self.baudrate
+        if self.cs.falls != self._falls:
+            # count each chip-select assertion as one transaction
+            self._falls = self.cs.falls
+            self.transactions += 1
+            us += 1  # CS setup and hold
+        self.bytes += len(buf)
+        self.bus_us += us
+        CLOCK.advance(us)
+        if self.dc():
+            self.display.data(buf)
+        else:
+            for byte in buf:
+                self.display.command(byte)
+
+
+def main(argv=None):
+    # render a test card, mainly a smoke test of the emulator
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Render a test card through the emulated SSD1306")
+    parser.add_argument("output", help=".png or .pbm file to write")
+    parser.add_argument("--freq", type=int, default=400000)
+    parser.add_argument("--scale", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    install("air_qual_disp/lib")
+    from ssd1306 import SSD1306_I2C
+
+    bus = EmuI2C(freq=args.freq)
+    oled = SSD1306_I2C(128, 64, bus)
+    bus.reset()
+    oled.rect(0, 0, 128, 64, 1)
+    oled.text("SSD1306 emu", 8, 8)
+    oled.line(0, 63, 127, 16, 1)
+    oled.show()
+    assert bus.display.frame() == oled.buffer, "emulated RAM differs from the driver buffer"
+    bus.display.save(args.output, scale=args.scale)
+    print("{} transactions, {} bytes, {:.2f} ms at {} Hz".format(bus.transactions, bus.bytes, bus.bus_us / 1000, bus.freq))
+
+
+if __name__ == "__main__":
+    main()